@@ -5,7 +5,6 @@ oec.device
 
 import time
 import logging
-from more_itertools import chunked
 from coax import read_feature_ids, parse_features, ReadTerminalId, ReadExtendedId, \
                  TerminalType, LoadAddressCounterLo, LoadSecondaryControl, \
                  SecondaryControl, ProtocolError
@@ -34,8 +33,8 @@ class Device:
         """Execute one or more commands."""
         return self.interface.execute(address_commands(self.device_address, commands))
 
-    def execute_jumbo_write(self, data, create_first, create_subsequent, first_chunk_max_length_adjustment=-1):
-        """Execute a jumbo write command that can be split."""
+    def get_jumbo_write_commands(self, data, create_first, create_subsequent, first_chunk_max_length_adjustment=-1):
+        """Get the commands for a jumbo write that can be split."""
         max_length = None
 
         # The 3299 multiplexer appears to have some frame length limit, after which it will
@@ -55,7 +54,7 @@ class Device:
         if len(commands) > 1 and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f'Jumbo write split into {len(commands)}')
 
-        return self.execute(commands)
+        return commands
 
 class UnsupportedDeviceError(Exception):
     """Unsupported device."""
@@ -187,4 +186,4 @@ def _jumbo_write_split_data(data, max_length, first_chunk_max_length_adjustment=
     if isinstance(data, tuple):
         data = data[0] * data[1]
 
-    return [data[:first_chunk_max_length], *chunked(data[first_chunk_max_length:], max_length)]
+    return [data[:first_chunk_max_length], *(data[offset:offset+max_length] for offset in range(first_chunk_max_length, length, max_length))]
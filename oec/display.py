@@ -4,10 +4,8 @@ oec.display
 """
 
 from collections import namedtuple
-from itertools import zip_longest
+from contextlib import contextmanager
 import logging
-from more_itertools import interleave
-from sortedcontainers import SortedSet
 from coax import ReadAddressCounterHi, ReadAddressCounterLo, LoadAddressCounterHi, \
                  LoadAddressCounterLo, WriteData, EABLoadMask, EABWriteAlternate, Data
 
@@ -27,21 +25,22 @@ class Display:
 
         self.status_line = StatusLine(self)
 
-    def clear(self, clear_status_line=False):
-        """Clear the screen."""
-        (rows, columns) = self.dimensions
+        # Start address and data for clearing the screen, with and without the status line.
+        (rows, columns) = dimensions
 
-        if clear_status_line:
-            address = 0
-            count = (rows + 1) * columns
-        else:
-            address = columns
-            count = rows * columns
+        self._clear_writes = {
+            False: (columns, (b'\x00', rows * columns)),
+            True: (0, (b'\x00', (rows + 1) * columns))
+        }
 
-        regen_data = (b'\x00', count)
-        eab_data = (b'\x00', count) if self.has_eab else None
+        # Commands queued while a batch is open, see _batch().
+        self._batch_commands = None
+
+    def clear(self, clear_status_line=False):
+        """Clear the screen."""
+        (address, data) = self._clear_writes[bool(clear_status_line)]
 
-        self.write(regen_data, eab_data, address=address)
+        self.write(data, data if self.has_eab else None, address=address)
 
         self.move_cursor(row=0, column=0, force_load=True)
 
@@ -72,7 +71,7 @@ class Display:
                 raise ValueError('Regen and EAB data must be provided in same form')
 
         if restore_original_address:
-            original_address = self.address_counter if self.address_counter is not None else self._read_address_counter()
+            original_address = self._get_address_counter()
 
         address = self._calculate_address(address, index, row, column)
 
@@ -81,9 +80,9 @@ class Display:
 
         if eab_data is not None:
             if isinstance(regen_data, tuple):
-                data = (bytes(interleave(regen_data[0], eab_data[0])), regen_data[1])
+                data = (_interleave(regen_data[0], eab_data[0]), regen_data[1])
             else:
-                data = bytes(interleave(regen_data, eab_data))
+                data = _interleave(regen_data, eab_data)
 
             self._eab_write_alternate(data)
         else:
@@ -146,6 +145,14 @@ class Display:
 
         return address
 
+    def _get_address_counter(self):
+        # The address counter is only read from the terminal when it is not known, once
+        # read or loaded it is maintained by each write.
+        if self.address_counter is not None:
+            return self.address_counter
+
+        return self._read_address_counter()
+
     def _read_address_counter(self):
         [hi, lo] = self.terminal.execute([ReadAddressCounterHi(), ReadAddressCounterLo()])
 
@@ -154,39 +161,68 @@ class Display:
         return self.address_counter
 
     def _load_address_counter(self, address, force_load):
-        if address == self.address_counter and not force_load:
+        current_address = self.address_counter
+
+        if address == current_address and not force_load:
             return False
 
-        (hi, lo) = _split_address(address)
-        (current_hi, current_lo) = _split_address(self.address_counter)
+        # Bits set in the difference are the address counter bytes that need to be loaded.
+        if current_address is None or force_load:
+            difference = 0xffff
+        else:
+            difference = address ^ current_address
 
         commands = []
 
-        if hi != current_hi or force_load:
-            commands.append(LoadAddressCounterHi(hi))
+        if difference & 0xff00:
+            commands.append(LoadAddressCounterHi((address >> 8) & 0xff))
 
-        if lo != current_lo or force_load:
-            commands.append(LoadAddressCounterLo(lo))
+        if difference & 0x00ff:
+            commands.append(LoadAddressCounterLo(address & 0xff))
 
-        self.terminal.execute(commands)
+        self._execute(commands)
 
         self.address_counter = address
 
         return True
 
     def _write_data(self, data):
-        self.terminal.execute_jumbo_write(data, WriteData, Data, -1)
+        self._execute(self.terminal.get_jumbo_write_commands(data, WriteData, Data, -1))
 
     def _eab_write_alternate(self, data):
         # The EAB_WRITE_ALTERNATE command data must be split so that the two bytes
         # do not get separated, otherwise the write will be incorrect.
-        self.terminal.execute_jumbo_write(data, lambda chunk: EABWriteAlternate(self.eab_address, chunk), Data, -2)
+        self._execute(self.terminal.get_jumbo_write_commands(data, lambda chunk: EABWriteAlternate(self.eab_address, chunk), Data, -2))
+
+    def _execute(self, commands):
+        if self._batch_commands is not None:
+            self._batch_commands.extend(commands)
+            return
+
+        self.terminal.execute(commands)
+
+    @contextmanager
+    def _batch(self):
+        # Queue the address counter load and write commands, so that they can be executed
+        # together in a single interface transaction. Commands that return a response,
+        # such as reading the address counter, must not be executed in a batch.
+        self._batch_commands = []
+
+        try:
+            yield
+        finally:
+            (commands, self._batch_commands) = (self._batch_commands, None)
+
+        if commands:
+            self.terminal.execute(commands)
+
+def _interleave(regen_data, eab_data):
+    data = bytearray(len(regen_data) * 2)
 
-def _split_address(address):
-    if address is None:
-        return (None, None)
+    data[0::2] = regen_data
+    data[1::2] = eab_data
 
-    return ((address >> 8) & 0xff, address & 0xff)
+    return data
 
 class StatusLine:
     def __init__(self, display):
@@ -230,7 +266,14 @@ class BufferedDisplay(Display):
 
         self.regen_buffer = bytearray(length)
         self.eab_buffer = bytearray(length) if self.has_eab else None
-        self.dirty = SortedSet()
+
+        # One byte per address, set if the address has changed since it was last written.
+        self._dirty = bytearray(length)
+
+        # Maximum number of unchanged addresses between two dirty ranges for them to be
+        # merged and flushed as a single write. Rewriting a few unchanged addresses is
+        # cheaper than the additional address counter load and write command.
+        self.flush_merge_gap = 24
 
     def buffered_write_byte(self, regen_byte, eab_byte, address=None, index=None, row=None, column=None):
         if eab_byte is not None:
@@ -250,18 +293,83 @@ class BufferedDisplay(Display):
         if self.has_eab:
             self.eab_buffer[address] = eab_byte
 
-        self.dirty.add(address)
+        self._dirty[address] = 1
 
         return True
 
+    def buffered_write(self, regen_data, eab_data, address=None, index=None, row=None, column=None):
+        if eab_data is not None:
+            if not self.has_eab:
+                raise RuntimeError('No EAB feature')
+
+            if len(regen_data) != len(eab_data):
+                raise ValueError('Regen and EAB data length must be equal')
+
+        address = self._calculate_address(address, index, row, column)
+
+        if address is None:
+            raise ValueError('Either address, index or row and column is required')
+
+        end_address = address + len(regen_data)
+
+        if end_address > len(self.regen_buffer):
+            raise ValueError('Length is out of range')
+
+        # An EAB display is written without changing the EAB buffer if no EAB data is
+        # provided. Only the addresses that have changed are marked as dirty, as with
+        # buffered_write_byte.
+        is_changed = False
+
+        for (offset, regen_byte) in enumerate(regen_data):
+            current_address = address + offset
+
+            eab_byte = eab_data[offset] if eab_data is not None else None
+
+            if self.regen_buffer[current_address] == regen_byte and (eab_byte is None or self.eab_buffer[current_address] == eab_byte):
+                continue
+
+            self.regen_buffer[current_address] = regen_byte
+
+            if eab_byte is not None:
+                self.eab_buffer[current_address] = eab_byte
+
+            self._dirty[current_address] = 1
+
+            is_changed = True
+
+        return is_changed
+
+    @property
+    def dirty(self):
+        """Addresses that have changed since they were last written.
+
+        This builds a new list on each access and is intended for tests, flush() works
+        on the dirty ranges directly.
+        """
+        return [address for (address, is_dirty) in enumerate(self._dirty) if is_dirty]
+
     def flush(self):
         dirty_ranges = self._get_dirty_ranges()
 
         if not dirty_ranges:
             return False
 
-        for (start_address, end_address) in dirty_ranges:
-            self._write_range(start_address, end_address)
+        # The batched commands are only executed after every range has been committed, so
+        # keep a copy of the dirty addresses to restore if the write fails.
+        dirty = bytes(self._dirty)
+
+        try:
+            with self._batch():
+                for (start_address, end_address) in dirty_ranges:
+                    self._write_range(start_address, end_address)
+        except Exception as error:
+            self.logger.error(f'Write error: {error}', exc_info=error)
+
+            # Retry the ranges on the next flush, the address counter is unknown as it is
+            # not possible to tell which commands were executed.
+            self._dirty[:] = dirty
+
+            self.address_counter = None
 
         return True
 
@@ -270,7 +378,7 @@ class BufferedDisplay(Display):
 
         # Unlike a unbuffered write, the current address is required in order to commit the write.
         if start_address is None:
-            start_address = self.address_counter if self.address_counter is not None else self._read_address_counter()
+            start_address = self._get_address_counter()
 
         super().write(regen_data, eab_data, address=address, index=index, row=row, column=column,
                       restore_original_address=restore_original_address)
@@ -279,23 +387,21 @@ class BufferedDisplay(Display):
 
     def _commit(self, start_address, regen_data, eab_data):
         if isinstance(regen_data, tuple):
-            expanded_regen_data = regen_data[0] * regen_data[1]
-            expanded_eab_data = eab_data[0] * eab_data[1] if eab_data is not None else []
-        else:
-            expanded_regen_data = regen_data
-            expanded_eab_data = eab_data if eab_data is not None else []
+            regen_data = regen_data[0] * regen_data[1]
+            eab_data = eab_data[0] * eab_data[1] if eab_data is not None else None
 
-        address = start_address
+        end_address = start_address + len(regen_data)
 
-        for (regen_byte, eab_byte) in zip_longest(expanded_regen_data, expanded_eab_data):
-            self.regen_buffer[address] = regen_byte
+        # Slice assignment would resize the buffers rather than fail.
+        if end_address > len(self.regen_buffer):
+            raise ValueError('Length is out of range')
 
-            if eab_byte is not None:
-                self.eab_buffer[address] = eab_byte
+        self.regen_buffer[start_address:end_address] = regen_data
 
-            self.dirty.discard(address)
+        if eab_data is not None:
+            self.eab_buffer[start_address:end_address] = eab_data
 
-            address += 1
+        self._dirty[start_address:end_address] = bytes(end_address - start_address)
 
     def _write_range(self, start_address, end_address):
         if self.logger.isEnabledFor(logging.DEBUG):
@@ -304,18 +410,47 @@ class BufferedDisplay(Display):
         regen_data = self.regen_buffer[start_address:end_address+1]
         eab_data = self.eab_buffer[start_address:end_address+1] if self.has_eab else None
 
-        try:
-            self.write(regen_data, eab_data, address=start_address)
-        except Exception as error:
-            # TODO: This could leave the address_counter incorrect.
-            self.logger.error(f'Write error: {error}', exc_info=error)
+        # Send a run of a single repeated byte as a repeat, regen and EAB data must both
+        # be repeats for this to be possible.
+        repeat_regen_data = _get_repeat(regen_data)
+        repeat_eab_data = _get_repeat(eab_data) if eab_data is not None else None
+
+        if repeat_regen_data is not None and (eab_data is None or repeat_eab_data is not None):
+            (regen_data, eab_data) = (repeat_regen_data, repeat_eab_data)
+
+        self.write(regen_data, eab_data, address=start_address)
 
     def _get_dirty_ranges(self):
-        if not self.dirty:
-            return []
+        ranges = []
+
+        start_address = self._dirty.find(1)
+
+        while start_address != -1:
+            end_address = self._dirty.find(0, start_address)
 
-        # TODO: Implement multiple ranges with optimization.
-        return [(self.dirty[0], self.dirty[-1])]
+            if end_address == -1:
+                end_address = len(self._dirty)
+
+            # The end address of a range is inclusive.
+            end_address -= 1
+
+            if ranges and start_address - ranges[-1][1] - 1 <= self.flush_merge_gap:
+                ranges[-1] = (ranges[-1][0], end_address)
+            else:
+                ranges.append((start_address, end_address))
+
+            start_address = self._dirty.find(1, end_address + 1)
+
+        return ranges
+
+# Minimum length of a run of a single repeated byte to send as a repeat.
+_MIN_REPEAT_LENGTH = 8
+
+def _get_repeat(data):
+    if len(data) < _MIN_REPEAT_LENGTH or data.count(data[0]) != len(data):
+        return None
+
+    return (bytes(data[:1]), len(data))
 
 CHAR_MAP = {
     '>': 0x08,
@@ -451,6 +586,14 @@ def encode_character(character):
     """Map a character to a terminal display character."""
     return CHAR_MAP.get(character, 0x00)
 
+# Latin-1 code point to terminal display character translation table.
+_ENCODE_TABLE = bytes(encode_character(chr(code_point)) for code_point in range(256))
+
 def encode_string(string):
     """Map a string to terminal display characters."""
-    return bytes(map(encode_character, string))
+    try:
+        return string.encode('latin-1').translate(_ENCODE_TABLE)
+    except UnicodeEncodeError:
+        # Characters outside of Latin-1 are not mapped, so fall back to mapping each
+        # character individually.
+        return bytes(map(encode_character, string))
@@ -24,6 +24,8 @@ class ExecuteError(Exception):
         self.responses = responses
 
 class InterfaceWrapper:
+    __slots__ = ('interface', 'timeout', 'jumbo_write_strategy', 'jumbo_write_max_length')
+
     def __init__(self, interface):
         self.interface = interface
 
@@ -51,7 +53,7 @@ class InterfaceWrapper:
         responses = self.interface.execute(commands, self.timeout)
         errors = get_errors(responses, receive_timeout_is_error)
 
-        if any(errors):
+        if errors:
             raise ExecuteError(errors, responses)
 
         return responses
@@ -21,15 +21,20 @@ class KeyboardModifiers(Flag):
 
     def is_shift(self):
         """Is either SHIFT key pressed?"""
-        return bool(self & (KeyboardModifiers.LEFT_SHIFT | KeyboardModifiers.RIGHT_SHIFT))
+        return bool(self.value & _SHIFT_VALUE)
 
     def is_alt(self):
         """Is either ALT key pressed?"""
-        return bool(self & (KeyboardModifiers.LEFT_ALT | KeyboardModifiers.RIGHT_ALT))
+        return bool(self.value & _ALT_VALUE)
 
     def is_caps_lock(self):
         """Is CAPS LOCK toggled on?"""
-        return bool(self & KeyboardModifiers.CAPS_LOCK)
+        return bool(self.value & _CAPS_LOCK_VALUE)
+
+# Modifier mask values, testing the raw value avoids creating a new flag for each test.
+_SHIFT_VALUE = (KeyboardModifiers.LEFT_SHIFT | KeyboardModifiers.RIGHT_SHIFT).value
+_ALT_VALUE = (KeyboardModifiers.LEFT_ALT | KeyboardModifiers.RIGHT_ALT).value
+_CAPS_LOCK_VALUE = KeyboardModifiers.CAPS_LOCK.value
 
 class Key(Enum):
     """Keyboad key."""
@@ -274,6 +279,8 @@ Keymap = namedtuple('Keymap', ['name', 'default', 'shift', 'alt', 'modifier_rele
 class Keyboard:
     """Keyboard state and key mapping."""
 
+    __slots__ = ('keymap', 'modifiers', 'single_modifier_release', 'modifier_release', 'clicker')
+
     def __init__(self, keymap):
         if keymap is None:
             raise ValueError('Keymap is required')
@@ -365,14 +372,9 @@ class Keyboard:
 
         return (False, None)
 
+# Keys with a value in the Latin-1 range map to the character with that code point.
+KEY_CHARACTER_MAP = {key: chr(key.value) for key in Key if key.value <= 255}
+
 def get_character_for_key(key):
     """Map a key to a character."""
-    if not key:
-        return None
-
-    value = key.value
-
-    if value > 255:
-        return None
-
-    return chr(value)
+    return KEY_CHARACTER_MAP.get(key)
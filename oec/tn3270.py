@@ -4,6 +4,7 @@ oec.tn3270
 """
 
 import logging
+from functools import lru_cache
 from tn3270 import Telnet, TN3270EFunction, Emulator, AttributeCell, CharacterCell, AID, Color, \
                    Highlight, OperatorError, ProtectedCellOperatorError, FieldOverflowOperatorError
 from tn3270.ebcdic import DUP, FM
@@ -156,7 +157,7 @@ class TN3270Session(Session):
                 character = get_character_for_key(key)
 
                 if character:
-                    byte = character.encode(self.character_encoding)[0]
+                    byte = _encode_host_character(character, self.character_encoding)
 
                     self.emulator.input(byte, self.keyboard_insert)
         except OperatorError as error:
@@ -272,9 +273,11 @@ def _map_cell(cell, character_encoding, has_eab):
         elif byte == FM:
             regen_byte = encode_character(';')
         else:
-            character = bytes([byte]).decode(character_encoding)
+            regen_byte = _get_character_table(character_encoding)[byte]
 
-            regen_byte = encode_character(character)
+            if regen_byte is None:
+                # Decode the byte again so that the original error is raised.
+                regen_byte = encode_character(bytes([byte]).decode(character_encoding))
 
     if not has_eab:
         return (regen_byte, None)
@@ -283,6 +286,24 @@ def _map_cell(cell, character_encoding, has_eab):
 
     return (regen_byte, eab_byte)
 
+@lru_cache(maxsize=None)
+def _get_character_table(character_encoding):
+    # Map every host byte to a terminal display character once, instead of decoding
+    # each cell as it is rendered. Bytes that cannot be decoded are left as None.
+    table = []
+
+    for byte in range(256):
+        try:
+            table.append(encode_character(bytes([byte]).decode(character_encoding)))
+        except UnicodeDecodeError:
+            table.append(None)
+
+    return tuple(table)
+
+@lru_cache(maxsize=None)
+def _encode_host_character(character, character_encoding):
+    return character.encode(character_encoding)[0]
+
 def _map_formatting(formatting):
     if formatting is None:
         return 0x00
@@ -9,8 +9,8 @@ from ptyprocess import PtyProcess
 import pyte
 
 from .session import Session, SessionDisconnectedError
-from .display import encode_character
-from .keyboard import Key, get_character_for_key, MODIFIER_KEYS
+from .display import encode_string
+from .keyboard import Key, KEY_CHARACTER_MAP, MODIFIER_KEYS
 
 VT100_KEY_MAP = {
     Key.NOT: b'^',
@@ -67,6 +67,12 @@ VT100_KEY_MAP_ALT = {
     Key.NEWLINE: b'\n'
 }
 
+# Bytes to send for a key without ALT, this combines the key map with the printable
+# characters so that a key is mapped with a single lookup.
+_KEY_BYTES = {key: character.encode() for (key, character) in KEY_CHARACTER_MAP.items() if character.isprintable()}
+
+_KEY_BYTES.update(VT100_KEY_MAP)
+
 class VT100Session(Session):
     """VT100 session."""
 
@@ -97,6 +103,10 @@ class VT100Session(Session):
 
         self.is_first_render = True
 
+        # Maximum number of bytes to read from the host process each time it is ready,
+        # bulk output is fed to the VT100 stream in fewer, larger reads.
+        self.host_read_size = 65536
+
     def start(self):
         self._start_host_process()
 
@@ -111,7 +121,7 @@ class VT100Session(Session):
         data = None
 
         try:
-            data = self.host_process.read()
+            data = self.host_process.read(self.host_read_size)
         except EOFError:
             self.host_process = None
 
@@ -152,15 +162,7 @@ class VT100Session(Session):
 
             self.logger.warning(f'No key mapping found for ALT + {key}')
         else:
-            bytes_ = VT100_KEY_MAP.get(key)
-
-            if bytes_ is not None:
-                return bytes_
-
-            character = get_character_for_key(key)
-
-            if character and character.isprintable():
-                return character.encode()
+            return _KEY_BYTES.get(key)
 
         return None
 
@@ -186,17 +188,21 @@ class VT100Session(Session):
     def _apply(self):
         has_eab = self.terminal.display.has_eab
 
+        columns = self.terminal.display.dimensions.columns
+
+        # Each dirty row is written to the display buffer at once.
+        eab_data = bytes(columns) if has_eab else None
+
         for row in self.vt100_screen.dirty:
             row_buffer = self.vt100_screen.buffer[row]
 
-            for column in range(self.terminal.display.dimensions.columns):
-                character = row_buffer[column]
+            # TODO: Investigate multi-byte or zero-byte cases further.
+            characters = ''.join(character.data if len(character.data) == 1 else '\x00'
+                                 for character in (row_buffer[column] for column in range(columns)))
 
-                # TODO: Investigate multi-byte or zero-byte cases further.
-                regen_byte = encode_character(character.data) if len(character.data) == 1 else 0x00
-                eab_byte = 0x00 if has_eab else None
+            regen_data = encode_string(characters)
 
-                self.terminal.display.buffered_write_byte(regen_byte, eab_byte, row=row, column=column)
+            self.terminal.display.buffered_write(regen_data, eab_data, row=row, column=0)
 
         self.vt100_screen.dirty.clear()
 
@@ -0,0 +1,31 @@
+from oec.display import BufferedDisplay
+
+class RecordingBufferedDisplay(BufferedDisplay):
+    """Record the calls made by a render."""
+
+    def __init__(self, terminal, dimensions, eab_address):
+        super().__init__(terminal, dimensions, eab_address)
+
+        self.buffered_writes = []
+        self.flush_count = 0
+        self.cursor_moves = []
+
+    def buffered_write_byte(self, regen_byte, eab_byte, address=None, index=None, row=None, column=None):
+        self.buffered_writes.append((regen_byte, eab_byte, index, row, column))
+
+        return super().buffered_write_byte(regen_byte, eab_byte, address=address, index=index, row=row, column=column)
+
+    def buffered_write(self, regen_data, eab_data, address=None, index=None, row=None, column=None):
+        self.buffered_writes.append((bytes(regen_data), eab_data, index, row, column))
+
+        return super().buffered_write(regen_data, eab_data, address=address, index=index, row=row, column=column)
+
+    def flush(self):
+        self.flush_count += 1
+
+        return super().flush()
+
+    def move_cursor(self, **kwargs):
+        self.cursor_moves.append(kwargs)
+
+        return super().move_cursor(**kwargs)
@@ -16,6 +16,14 @@ from oec.session import Session, SessionDisconnectedError
 from mock_interface import MockInterface
 
 class UpdateSessionsTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        patcher = patch('oec.controller.time.perf_counter')
+
+        cls.perf_counter = patcher.start()
+
+        cls.addClassCleanup(patcher.stop)
+
     def setUp(self):
         self.interface = MockInterface()
 
@@ -23,11 +31,7 @@ class UpdateSessionsTestCase(unittest.TestCase):
 
         self.controller.session_selector = create_autospec(BaseSelector, instance=True)
 
-        patcher = patch('oec.controller.time.perf_counter')
-
-        self.perf_counter = patcher.start()
-
-        self.addCleanup(patch.stopall)
+        self.perf_counter.reset_mock(return_value=True, side_effect=True)
 
     def test_no_sessions(self):
         # Arrange
@@ -256,6 +260,14 @@ class PollAttachedDevicesTestCase(unittest.TestCase):
         self.interface.assert_command_executed(None, PollAck)
 
 class PollNextDetatchedDeviceTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        patcher = patch('oec.controller.time.perf_counter')
+
+        cls.perf_counter = patcher.start()
+
+        cls.addClassCleanup(patcher.stop)
+
     def setUp(self):
         self.interface = MockInterface()
 
@@ -263,11 +275,7 @@ class PollNextDetatchedDeviceTestCase(unittest.TestCase):
 
         self.controller = Controller(InterfaceWrapper(self.interface), None, None)
 
-        patcher = patch('oec.controller.time.perf_counter')
-
-        self.perf_counter = patcher.start()
-
-        self.addCleanup(patch.stopall)
+        self.perf_counter.reset_mock(return_value=True, side_effect=True)
 
     def test_poll_period_not_expired(self):
         # Arrange
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 from logging import Logger
 from coax import TerminalType, Feature, ReadAddressCounterHi, ReadAddressCounterLo, ReadTerminalId, ReadExtendedId, ReadFeatureId, ProtocolError, LoadAddressCounterLo, LoadSecondaryControl
@@ -47,18 +47,25 @@ class FormatAddressTestCase(unittest.TestCase):
         self.assertEqual(format_address(InterfaceWrapper(self.interface), 0b111111), '/dev/mock?111111')
 
 class GetIdsTestCase(unittest.TestCase):
-    def setUp(self):
-        self.interface = MockInterface()
-
+    @classmethod
+    def setUpClass(cls):
         patcher = patch('oec.device.logger', autospec=Logger)
 
-        self.logger = patcher.start()
+        cls.logger = patcher.start()
+
+        cls.addClassCleanup(patcher.stop)
 
         patcher = patch('oec.device.time.sleep')
 
-        self.sleep = patcher.start()
+        cls.sleep = patcher.start()
+
+        cls.addClassCleanup(patcher.stop)
 
-        self.addCleanup(patch.stopall)
+    def setUp(self):
+        self.interface = MockInterface()
+
+        self.logger.reset_mock()
+        self.sleep.reset_mock(return_value=True, side_effect=True)
 
     def test_dft(self):
         # Arrange
@@ -110,7 +117,7 @@ class GetIdsTestCase(unittest.TestCase):
     def test_terminal_id_error(self):
         # Arrange
         self.interface.mock_responses = [
-            (None, ReadTerminalId, None, Mock(side_effect=ProtocolError))
+            (None, ReadTerminalId, None, ProtocolError)
         ]
 
         # Act
@@ -126,7 +133,7 @@ class GetIdsTestCase(unittest.TestCase):
         # Arrange
         self.interface.mock_responses = [
             (None, ReadTerminalId, None, TerminalId(0b11110100)),
-            (None, ReadExtendedId, None, Mock(side_effect=ProtocolError))
+            (None, ReadExtendedId, None, ProtocolError)
         ]
 
         # Act
@@ -182,9 +189,20 @@ class GetKeyboardDescriptionTestCase(unittest.TestCase):
 
                 self.assertEqual(description, expected_description)
 
+def _create_split_data(length):
+    return (bytes(range(0, length)), (bytes.fromhex('00'), length))
+
+# Data and repeat inputs of each length, shared by the split tests.
+SPLIT_DATA_16 = _create_split_data(16)
+SPLIT_DATA_31 = _create_split_data(31)
+SPLIT_DATA_32 = _create_split_data(32)
+SPLIT_DATA_63 = _create_split_data(63)
+SPLIT_DATA_64 = _create_split_data(64)
+SPLIT_DATA_95 = _create_split_data(95)
+
 class JumboWriteSplitDataTestCase(unittest.TestCase):
     def test_no_split_strategy(self):
-        for data in [bytes(range(0, 64)), (bytes.fromhex('00'), 64)]:
+        for data in SPLIT_DATA_64:
             with self.subTest(data=data):
                 result = _jumbo_write_split_data(data, None)
 
@@ -193,7 +211,7 @@ class JumboWriteSplitDataTestCase(unittest.TestCase):
                 self.assertEqual(result[0], data)
 
     def test_split_strategy_one_chunk(self):
-        for data in [bytes(range(0, 16)), (bytes.fromhex('00'), 16), bytes(range(0, 31)), (bytes.fromhex('00'), 31)]:
+        for data in SPLIT_DATA_16 + SPLIT_DATA_31:
             with self.subTest(data=data):
                 result = _jumbo_write_split_data(data, 32)
 
@@ -202,7 +220,7 @@ class JumboWriteSplitDataTestCase(unittest.TestCase):
                 self.assertEqual(result[0], data)
 
     def test_split_strategy_two_chunks(self):
-        for data in [bytes(range(0, 32)), (bytes.fromhex('00'), 32), bytes(range(0, 63)), (bytes.fromhex('00'), 63)]:
+        for data in SPLIT_DATA_32 + SPLIT_DATA_63:
             with self.subTest(data=data):
                 result = _jumbo_write_split_data(data, 32)
 
@@ -210,7 +228,7 @@ class JumboWriteSplitDataTestCase(unittest.TestCase):
                 self.assertEqual(len(result[0]), 31)
 
     def test_split_strategy_three_chunks(self):
-        for data in [bytes(range(0, 64)), (bytes.fromhex('00'), 64), bytes(range(0, 95)), (bytes.fromhex('00'), 95)]:
+        for data in SPLIT_DATA_64 + SPLIT_DATA_95:
             with self.subTest(data=data):
                 result = _jumbo_write_split_data(data, 32)
 
@@ -1,7 +1,7 @@
 import unittest
-from unittest.mock import Mock, create_autospec
+from unittest.mock import call, create_autospec
 
-from coax import ReadAddressCounterHi, ReadAddressCounterLo, LoadAddressCounterHi, LoadAddressCounterLo, Feature
+from coax import ReadAddressCounterHi, ReadAddressCounterLo, LoadAddressCounterHi, LoadAddressCounterLo, WriteData, Feature, ProtocolError
 from coax.protocol import TerminalId
 
 import context
@@ -13,87 +13,94 @@ from oec.keymap_3278_typewriter import KEYMAP
 
 from mock_interface import MockInterface
 
+DIMENSIONS = Dimensions(24, 80)
+
+B123 = b'\x01\x02\x03'
+B456 = b'\x04\x05\x06'
+B142536 = b'\x01\x04\x02\x05\x03\x06'
+B111213 = b'\x11\x12\x13'
+
+EXPECTED_REGEN_MULTI = B123 + bytes(17) + b'\x04' + bytes(9) + b'\x05\x06\x07'
+EXPECTED_EAB_MULTI = B111213 + bytes(17) + b'\x14' + bytes(9) + b'\x15\x16\x17'
+
+# Display buffers include the status line row.
+ZEROS = bytes(2000)
+
+CLEAR_1920 = (b'\x00', 1920)
+CLEAR_2000 = (b'\x00', 2000)
+
 class DisplayClearTestCase(unittest.TestCase):
     def setUp(self):
         self.interface = MockInterface()
 
-        self.display = _create_display(self.interface)
-
-        self.display.write = Mock(wraps=self.display.write)
-        self.display._load_address_counter = Mock(wraps=self.display._load_address_counter)
-
     def test_excluding_status_line_with_no_eab_feature(self):
-        # Act
-        self.display.clear(clear_status_line=False)
+        self._assert_clear(False, clear_status_line=False, data=CLEAR_1920, address=80)
 
-        # Assert
-        self.display.write.assert_called_with((b'\x00', 1920), None, address=80)
-        self.display._load_address_counter.assert_called_with(80, True)
+    def test_excluding_status_line_with_eab_feature(self):
+        self._assert_clear(True, clear_status_line=False, data=CLEAR_1920, address=80)
 
-    def test_excluding_status_line_with_eab(self):
-        # Arrange
-        self.display.eab_address = 7
+    def test_including_status_line_with_no_eab_feature(self):
+        self._assert_clear(False, clear_status_line=True, data=CLEAR_2000, address=0)
 
-        # Act
-        self.display.clear(clear_status_line=False)
+    def test_including_status_line_with_eab_feature(self):
+        self._assert_clear(True, clear_status_line=True, data=CLEAR_2000, address=0)
 
-        # Assert
-        self.display.write.assert_called_with((b'\x00', 1920), (b'\x00', 1920), address=80)
-        self.display._load_address_counter.assert_called_with(80, True)
+    def _assert_clear(self, has_eab, clear_status_line, data, address):
+        for create_display in [_create_display, _create_buffered_display]:
+            with self.subTest(display=create_display.__name__):
+                display = create_display(self.interface, has_eab=has_eab)
 
-    def test_including_status_line_with_no_eab_feature(self):
-        # Act
-        self.display.clear(clear_status_line=True)
+                display.write = _LastCallSpy(display.write)
+                display._load_address_counter = _LastCallSpy(display._load_address_counter)
 
-        # Assert
-        self.display.write.assert_called_with((b'\x00', 2000), None, address=0)
-        self.display._load_address_counter.assert_called_with(80, True)
+                is_buffered = isinstance(display, BufferedDisplay)
 
-    def test_including_status_line_with_eab(self):
-        # Arrange
-        self.display.eab_address = 7
+                # Arrange
+                if is_buffered:
+                    display.buffered_write_byte(0x01, 0x02 if has_eab else None, address=80)
 
-        # Act
-        self.display.clear(clear_status_line=True)
+                    self.assertTrue(display.dirty)
 
-        # Assert
-        self.display.write.assert_called_with((b'\x00', 2000), (b'\x00', 2000), address=0)
-        self.display._load_address_counter.assert_called_with(80, True)
+                # Act
+                display.clear(clear_status_line=clear_status_line)
 
-class DisplayMoveCursorTestCase(unittest.TestCase):
-    def setUp(self):
-        self.interface = MockInterface()
+                # Assert
+                display.write.assert_called_with(data, data if has_eab else None, address=address)
+                display._load_address_counter.assert_called_with(80, True)
 
-        self.display = _create_display(self.interface)
+                if is_buffered:
+                    self.assertEqual(display.regen_buffer, ZEROS)
 
-        self.display._load_address_counter = Mock(wraps=self.display._load_address_counter)
+                    if has_eab:
+                        self.assertEqual(display.eab_buffer, ZEROS)
 
-    def test_with_address(self):
-        # Act
-        self.display.move_cursor(address=895)
+                    self.assertFalse(display.dirty)
 
-        # Assert
-        self.assertEqual(self.display.address_counter, 895)
+class DisplayMoveCursorTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.interface = MockInterface()
 
-        self.display._load_address_counter.assert_called_with(895, False)
+    def setUp(self):
+        self.interface.reset_mock()
 
-    def test_with_index(self):
-        # Act
-        self.display.move_cursor(index=815)
+        self.display = _create_display(self.interface)
 
-        # Assert
-        self.assertEqual(self.display.address_counter, 895)
+        self.display._load_address_counter = _LastCallSpy(self.display._load_address_counter)
 
-        self.display._load_address_counter.assert_called_with(895, False)
+    def test_with_address_index_or_row_and_column(self):
+        for kwargs in [{ 'address': 895 }, { 'index': 815 }, { 'row': 10, 'column': 15 }]:
+            with self.subTest(**kwargs):
+                # Arrange
+                self.display.address_counter = None
 
-    def test_with_row_and_column(self):
-        # Act
-        self.display.move_cursor(row=10, column=15)
+                # Act
+                self.display.move_cursor(**kwargs)
 
-        # Assert
-        self.assertEqual(self.display.address_counter, 895)
+                # Assert
+                self.assertEqual(self.display.address_counter, 895)
 
-        self.display._load_address_counter.assert_called_with(895, False)
+                self.display._load_address_counter.assert_called_with(895, False)
 
     def test_force(self):
         # Act
@@ -105,20 +112,21 @@ class DisplayMoveCursorTestCase(unittest.TestCase):
         self.display._load_address_counter.assert_called_with(895, True)
 
 class DisplayWriteTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.interface = MockInterface()
+
     def setUp(self):
-        self.interface = MockInterface()
+        self.interface.reset_mock()
 
         self.display = _create_display(self.interface)
 
-        self.display._read_address_counter = Mock(wraps=self.display._read_address_counter)
-        self.display._load_address_counter = Mock(wraps=self.display._load_address_counter)
-        self.display._write_data = Mock(wraps=self.display._write_data)
-        self.display._eab_write_alternate = Mock(wraps=self.display._eab_write_alternate)
+        _wrap_write_methods(self.display, ['_write_data', '_eab_write_alternate'])
 
     def test_no_eab_feature(self):
         # Act and assert
         with self.assertRaisesRegex(RuntimeError, 'No EAB feature'):
-            self.display.write(bytes.fromhex('01 02 03'), (b'\x00', 3))
+            self.display.write(B123, (b'\x00', 3))
 
     def test_regen_eab_data_mismatch_format(self):
         # Arrange
@@ -126,7 +134,7 @@ class DisplayWriteTestCase(unittest.TestCase):
 
         # Act and assert
         with self.assertRaisesRegex(ValueError, 'must be provided in same form'):
-            self.display.write(bytes.fromhex('01 02 03'), (b'\x00', 3))
+            self.display.write(B123, (b'\x00', 3))
 
     def test_regen_eab_data_mismatch_length(self):
         # Arrange
@@ -134,7 +142,7 @@ class DisplayWriteTestCase(unittest.TestCase):
 
         # Act and assert
         with self.assertRaisesRegex(ValueError, 'data length must be equal'):
-            self.display.write(bytes.fromhex('01 02 03'), bytes.fromhex('01 02'))
+            self.display.write(B123, bytes.fromhex('01 02'))
 
     def test_regen_eab_data_mismatch_length_repeat(self):
         # Arrange
@@ -142,7 +150,7 @@ class DisplayWriteTestCase(unittest.TestCase):
 
         # Act and assert
         with self.assertRaisesRegex(ValueError, 'pattern length must be equal'):
-            self.display.write((bytes.fromhex('01 02 03'), 3), (b'\x00', 3))
+            self.display.write((B123, 3), (b'\x00', 3))
 
     def test_regen_eab_data_mismatch_count_repeat(self):
         # Arrange
@@ -150,14 +158,64 @@ class DisplayWriteTestCase(unittest.TestCase):
 
         # Act and assert
         with self.assertRaisesRegex(ValueError, 'pattern count must be equal'):
-            self.display.write((bytes.fromhex('01 02 03'), 3), (bytes.fromhex('01 02 03'), 2))
+            self.display.write((B123, 3), (B123, 2))
+
+    def test_regen_only(self):
+        # Arrange
+        self.display.address_counter = 80
+
+        # Act
+        self.display.write(B123, None)
+
+        # Assert
+        self.display._write_data.assert_called_with(B123)
+
+    def test_regen_only_repeat(self):
+        # Arrange
+        self.display.address_counter = 80
+
+        # Act
+        self.display.write((B123, 2), None)
+
+        # Assert
+        self.display._write_data.assert_called_with((B123, 2))
+
+    def test_regen_eab(self):
+        # Arrange
+        self.display.eab_address = 7
+        self.display.address_counter = 80
+
+        # Act
+        self.display.write(B123, B456)
+
+        # Assert
+        self.display._eab_write_alternate.assert_called_with(B142536)
+
+    def test_regen_eab_repeat(self):
+        # Arrange
+        self.display.eab_address = 7
+        self.display.address_counter = 80
+
+        # Act
+        self.display.write((B123, 2), (B456, 2))
+
+        # Assert
+        self.display._eab_write_alternate.assert_called_with((B142536, 2))
+
+class DisplayWriteAddressTestCase(unittest.TestCase):
+    def setUp(self):
+        self.interface = MockInterface()
+
+        self.display = _create_display(self.interface)
+
+        _wrap_write_methods(self.display, ['_read_address_counter', '_load_address_counter'])
 
     def test_if_current_address_unknown(self):
         # Arrange
         self.assertIsNone(self.display.address_counter)
 
         # Act
-        self.display.write(bytes.fromhex('01 02 03'), None)
+        self.display.write(B123, None)
 
         # Assert
         self.assertIsNone(self.display.address_counter)
@@ -170,7 +228,7 @@ class DisplayWriteTestCase(unittest.TestCase):
         self.assertIsNone(self.display.address_counter)
 
         # Act
-        self.display.write(bytes.fromhex('01 02 03'), None, address=80)
+        self.display.write(B123, None, address=80)
 
         # Assert
         self.assertEqual(self.display.address_counter, 83)
@@ -183,7 +241,7 @@ class DisplayWriteTestCase(unittest.TestCase):
         self.display.address_counter = 160
 
         # Act
-        self.display.write(bytes.fromhex('01 02 03'), None, address=80)
+        self.display.write(B123, None, address=80)
 
         # Assert
         self.assertEqual(self.display.address_counter, 83)
@@ -196,7 +254,7 @@ class DisplayWriteTestCase(unittest.TestCase):
         self.display.address_counter = 80
 
         # Act
-        self.display.write(bytes.fromhex('01 02 03'), None, address=80)
+        self.display.write(B123, None, address=80)
 
         # Assert
         self.assertEqual(self.display.address_counter, 83)
@@ -214,7 +272,7 @@ class DisplayWriteTestCase(unittest.TestCase):
         ]
 
         # Act
-        self.display.write(bytes.fromhex('01 02 03'), None, restore_original_address=True)
+        self.display.write(B123, None, restore_original_address=True)
 
         # Assert
         self.assertEqual(self.display.address_counter, 160)
@@ -227,7 +285,7 @@ class DisplayWriteTestCase(unittest.TestCase):
         self.display.address_counter = 160
 
         # Act
-        self.display.write(bytes.fromhex('01 02 03'), None, restore_original_address=True)
+        self.display.write(B123, None, restore_original_address=True)
 
         # Assert
         self.assertEqual(self.display.address_counter, 160)
@@ -235,138 +293,53 @@ class DisplayWriteTestCase(unittest.TestCase):
         self.display._read_address_counter.assert_not_called()
         self.display._load_address_counter.assert_called_with(160, force_load=True)
 
-    def test_regen_only(self):
-        # Arrange
-        self.display.address_counter = 80
-
-        # Act
-        self.display.write(bytes.fromhex('01 02 03'), None)
-
-        # Assert
-        self.display._write_data.assert_called_with(bytes.fromhex('01 02 03'))
-
-    def test_regen_only_repeat(self):
-        # Arrange
-        self.display.address_counter = 80
-
-        # Act
-        self.display.write((bytes.fromhex('01 02 03'), 2), None)
-
-        # Assert
-        self.display._write_data.assert_called_with((bytes.fromhex('01 02 03'), 2))
-
-    def test_regen_eab(self):
-        # Arrange
-        self.display.eab_address = 7
-        self.display.address_counter = 80
-
-        # Act
-        self.display.write(bytes.fromhex('01 02 03'), bytes.fromhex('04 05 06'))
-
-        # Assert
-        self.display._eab_write_alternate.assert_called_with(bytes.fromhex('01 04 02 05 03 06'))
-
-    def test_regen_eab_repeat(self):
-        # Arrange
-        self.display.eab_address = 7
-        self.display.address_counter = 80
-
-        # Act
-        self.display.write((bytes.fromhex('01 02 03'), 2), (bytes.fromhex('04 05 06'), 2))
-
-        # Assert
-        self.display._eab_write_alternate.assert_called_with((bytes.fromhex('01 04 02 05 03 06'), 2))
-
 class DisplayLoadAddressCounterTestCase(unittest.TestCase):
-    def setUp(self):
-        self.interface = MockInterface()
+    @classmethod
+    def setUpClass(cls):
+        cls.interface = MockInterface()
 
-        self.display = _create_display(self.interface)
-
-    def test(self):
-        # Act
-        self.display._load_address_counter(895, force_load=False)
-
-        # Assert
-        self.assertEqual(self.display.address_counter, 895)
-
-        self.assert_load_address_counter_hi(3)
-        self.assert_load_address_counter_lo(127)
-
-    def test_hi_change(self):
-        # Arrange
-        self.display._load_address_counter(895, force_load=False)
-
-        self.interface.reset_mock()
-
-        # Act
-        self.display._load_address_counter(1151, force_load=False)
-
-        # Assert
-        self.assertEqual(self.display.address_counter, 1151)
-
-        self.assert_load_address_counter_hi(4)
-        self.interface.assert_command_not_executed(None, LoadAddressCounterLo)
-
-    def test_lo_change(self):
-        # Arrange
-        self.display._load_address_counter(895, force_load=False)
-
-        self.interface.reset_mock()
-
-        # Act
-        self.display._load_address_counter(896, force_load=False)
-
-        # Assert
-        self.assertEqual(self.display.address_counter, 896)
-
-        self.interface.assert_command_not_executed(None, LoadAddressCounterHi)
-        self.assert_load_address_counter_lo(128)
-
-    def test_hi_lo_change(self):
-        # Arrange
-        self.display._load_address_counter(895, force_load=False)
+        cls.display = _create_display(cls.interface)
 
+    def setUp(self):
         self.interface.reset_mock()
 
-        # Act
-        self.display._load_address_counter(1152, force_load=False)
-
-        # Assert
-        self.assertEqual(self.display.address_counter, 1152)
-
-        self.assert_load_address_counter_hi(4)
-        self.assert_load_address_counter_lo(128)
-
-    def test_no_change(self):
-        # Arrange
-        self.display._load_address_counter(80, force_load=False)
+        self.display.address_counter = None
 
-        self.interface.reset_mock()
-
-        # Act
-        self.display._load_address_counter(80, force_load=False)
+    def test(self):
+        CASES = [
+            (None, 895, False, 3, 127),
+            (895, 1151, False, 4, None),
+            (895, 896, False, None, 128),
+            (895, 1152, False, 4, 128),
+            (80, 80, False, None, None),
+            (80, 80, True, 0, 80)
+        ]
 
-        # Assert
-        self.assertEqual(self.display.address_counter, 80)
+        for (initial_address, address, force_load, expected_hi, expected_lo) in CASES:
+            with self.subTest(initial_address=initial_address, address=address, force_load=force_load):
+                # Arrange
+                self.display.address_counter = None
 
-        self.interface.assert_command_not_executed(None, LoadAddressCounterHi)
-        self.interface.assert_command_not_executed(None, LoadAddressCounterLo)
+                if initial_address is not None:
+                    self.display._load_address_counter(initial_address, force_load=False)
 
-    def test_no_change_force(self):
-        # Arrange
-        self.display._load_address_counter(80, force_load=False)
+                self.interface.reset_mock()
 
-        self.interface.reset_mock()
+                # Act
+                self.display._load_address_counter(address, force_load=force_load)
 
-        # Act
-        self.display._load_address_counter(80, force_load=True)
+                # Assert
+                self.assertEqual(self.display.address_counter, address)
 
-        # Assert
-        self.assertEqual(self.display.address_counter, 80)
+                if expected_hi is not None:
+                    self.assert_load_address_counter_hi(expected_hi)
+                else:
+                    self.interface.assert_command_not_executed(None, LoadAddressCounterHi)
 
-        self.assert_load_address_counter_hi(0)
-        self.assert_load_address_counter_lo(80)
+                if expected_lo is not None:
+                    self.assert_load_address_counter_lo(expected_lo)
+                else:
+                    self.interface.assert_command_not_executed(None, LoadAddressCounterLo)
 
     def assert_load_address_counter_hi(self, address):
         self.interface.assert_command_executed(None, LoadAddressCounterHi, lambda command: command.address == address)
@@ -375,31 +348,41 @@ class DisplayLoadAddressCounterTestCase(unittest.TestCase):
         self.interface.assert_command_executed(None, LoadAddressCounterLo, lambda command: command.address == address)
 
 class StatusLineWriteTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._display = create_autospec(Display, instance=True)
+
+        cls._display.dimensions = DIMENSIONS
+
     def setUp(self):
-        self.display = create_autospec(Display, instance=True)
+        self.display = self._display
 
-        self.display.dimensions = Dimensions(24, 80)
+        self.display.reset_mock()
 
         self.status_line = StatusLine(self.display)
 
     def test(self):
-        self.status_line.write(77, bytes.fromhex('01 02 03'))
+        self.status_line.write(77, B123)
 
     def test_column_out_of_range(self):
         with self.assertRaisesRegex(ValueError, 'Column is out of range'):
-            self.status_line.write(80, bytes.fromhex('01 02 03'))
+            self.status_line.write(80, B123)
 
     def test_length_out_of_range(self):
         with self.assertRaisesRegex(ValueError, 'Length is out of range'):
-            self.status_line.write(78, bytes.fromhex('01 02 03'))
+            self.status_line.write(78, B123)
 
 class BufferedDisplayBufferedWriteByteTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._terminal = create_autospec(Terminal, instance=True)
+
     def setUp(self):
-        self.terminal = create_autospec(Terminal, instance=True)
+        self.terminal = self._terminal
 
-        dimensions = Dimensions(24, 80)
+        self.terminal.reset_mock()
 
-        self.buffered_display = BufferedDisplay(self.terminal, dimensions, None)
+        self.buffered_display = BufferedDisplay(self.terminal, DIMENSIONS, None)
 
     def test_no_eab_feature(self):
         # Act and assert
@@ -427,15 +410,11 @@ class BufferedDisplayBufferedWriteByteTestCase(unittest.TestCase):
         # Act and assert
         self.assertTrue(self.buffered_display.buffered_write_byte(0x01, None, address=80))
 
-        self.assertSequenceEqual(self.buffered_display.dirty, [80])
-
-        self.assertEqual(self.buffered_display.regen_buffer[80], 0x01)
+        self.assertEqual(self._get_state(80), ([80], 0x01, None))
 
     def test_regen_no_change_eab_no_change(self):
         # Arrange
-        dimensions = Dimensions(24, 80)
-
-        self.buffered_display = BufferedDisplay(self.terminal, dimensions, 7)
+        self.buffered_display = BufferedDisplay(self.terminal, DIMENSIONS, 7)
 
         self.assertFalse(self.buffered_display.dirty)
 
@@ -446,51 +425,111 @@ class BufferedDisplayBufferedWriteByteTestCase(unittest.TestCase):
 
     def test_regen_change_eab_no_change(self):
         # Arrange
-        dimensions = Dimensions(24, 80)
-
-        self.buffered_display = BufferedDisplay(self.terminal, dimensions, 7)
+        self.buffered_display = BufferedDisplay(self.terminal, DIMENSIONS, 7)
 
         self.assertFalse(self.buffered_display.dirty)
 
         # Act and assert
         self.assertTrue(self.buffered_display.buffered_write_byte(0x01, 0x00, address=80))
 
-        self.assertSequenceEqual(self.buffered_display.dirty, [80])
-
-        self.assertEqual(self.buffered_display.regen_buffer[80], 0x01)
-        self.assertEqual(self.buffered_display.eab_buffer[80], 0x00)
+        self.assertEqual(self._get_state(80), ([80], 0x01, 0x00))
 
     def test_regen_no_change_eab_change(self):
         # Arrange
-        dimensions = Dimensions(24, 80)
-
-        self.buffered_display = BufferedDisplay(self.terminal, dimensions, 7)
+        self.buffered_display = BufferedDisplay(self.terminal, DIMENSIONS, 7)
 
         self.assertFalse(self.buffered_display.dirty)
 
         # Act and assert
         self.assertTrue(self.buffered_display.buffered_write_byte(0x00, 0x02, address=80))
 
-        self.assertSequenceEqual(self.buffered_display.dirty, [80])
-
-        self.assertEqual(self.buffered_display.regen_buffer[80], 0x00)
-        self.assertEqual(self.buffered_display.eab_buffer[80], 0x02)
+        self.assertEqual(self._get_state(80), ([80], 0x00, 0x02))
 
     def test_regen_change_eab_change(self):
         # Arrange
-        dimensions = Dimensions(24, 80)
-
-        self.buffered_display = BufferedDisplay(self.terminal, dimensions, 7)
+        self.buffered_display = BufferedDisplay(self.terminal, DIMENSIONS, 7)
 
         self.assertFalse(self.buffered_display.dirty)
 
         # Act and assert
         self.assertTrue(self.buffered_display.buffered_write_byte(0x01, 0x02, address=80))
 
-        self.assertSequenceEqual(self.buffered_display.dirty, [80])
+        self.assertEqual(self._get_state(80), ([80], 0x01, 0x02))
+
+    def _get_state(self, address):
+        # Snapshot the dirty addresses and buffers, so that they can be compared at once.
+        eab_byte = self.buffered_display.eab_buffer[address] if self.buffered_display.has_eab else None
+
+        return (self.buffered_display.dirty, self.buffered_display.regen_buffer[address], eab_byte)
+
+class BufferedDisplayBufferedWriteTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._terminal = create_autospec(Terminal, instance=True)
+
+    def setUp(self):
+        self.terminal = self._terminal
+
+        self.terminal.reset_mock()
+
+        self.buffered_display = BufferedDisplay(self.terminal, DIMENSIONS, None)
+
+    def test_no_eab_feature(self):
+        # Act and assert
+        with self.assertRaisesRegex(RuntimeError, 'No EAB feature'):
+            self.buffered_display.buffered_write(B123, B123, address=80)
+
+    def test_no_address(self):
+        # Act and assert
+        with self.assertRaisesRegex(ValueError, 'Either address, index or row and column is required'):
+            self.buffered_display.buffered_write(B123, None)
+
+    def test_length_out_of_range(self):
+        # Act and assert
+        with self.assertRaisesRegex(ValueError, 'Length is out of range'):
+            self.buffered_display.buffered_write(B123, None, address=1998)
+
+    def test_regen_no_change_with_no_eab_feature(self):
+        # Act and assert
+        self.assertFalse(self.buffered_display.buffered_write(bytes(3), None, address=80))
+
+        self.assertFalse(self.buffered_display.dirty)
+
+    def test_regen_change_with_no_eab_feature(self):
+        # Arrange
+        self.buffered_display.regen_buffer[81] = 0x02
+
+        # Act and assert
+        self.assertTrue(self.buffered_display.buffered_write(B123, None, row=0, column=0))
+
+        self.assertEqual(self.buffered_display.dirty, [80, 82])
+        self.assertEqual(self.buffered_display.regen_buffer[80:83], B123)
+
+    def test_regen_no_change_eab_change(self):
+        # Arrange
+        self.buffered_display = BufferedDisplay(self.terminal, DIMENSIONS, 7)
+
+        self.buffered_display.eab_buffer[81] = 0x05
+
+        # Act and assert
+        self.assertTrue(self.buffered_display.buffered_write(bytes(3), B456, address=80))
+
+        self.assertEqual(self.buffered_display.dirty, [80, 82])
+        self.assertEqual(self.buffered_display.eab_buffer[80:83], B456)
+
+    def test_regen_change_no_eab_data_with_eab_feature(self):
+        # Arrange
+        self.buffered_display = BufferedDisplay(self.terminal, DIMENSIONS, 7)
 
-        self.assertEqual(self.buffered_display.regen_buffer[80], 0x01)
-        self.assertEqual(self.buffered_display.eab_buffer[80], 0x02)
+        self.buffered_display.regen_buffer[81] = 0x02
+        self.buffered_display.eab_buffer[80:83] = B456
+
+        # Act and assert
+        self.assertTrue(self.buffered_display.buffered_write(B123, None, address=80))
+
+        self.assertEqual(self.buffered_display.dirty, [80, 82])
+        self.assertEqual(self.buffered_display.regen_buffer[80:83], B123)
+        self.assertEqual(self.buffered_display.eab_buffer[80:83], B456)
 
 class BufferedDisplayFlushTestCase(unittest.TestCase):
     def setUp(self):
@@ -498,7 +537,7 @@ class BufferedDisplayFlushTestCase(unittest.TestCase):
 
         self.buffered_display = _create_buffered_display(self.interface)
 
-        self.buffered_display.write = Mock(wraps=self.buffered_display.write)
+        self.buffered_display.write = _LastCallSpy(self.buffered_display.write)
 
     def test_no_changes(self):
         # Arrange
@@ -523,15 +562,15 @@ class BufferedDisplayFlushTestCase(unittest.TestCase):
         self.assertTrue(self.buffered_display.flush())
 
         self.assertFalse(self.buffered_display.dirty)
-        self.assertEqual(self.buffered_display.regen_buffer[80:83], bytes.fromhex('01 02 03'))
+        self.assertEqual(self.buffered_display.regen_buffer[80:83], B123)
 
-        self.buffered_display.write.assert_called_with(bytes.fromhex('01 02 03'), None, address=80)
+        self.buffered_display.write.assert_called_with(B123, None, address=80)
 
     def test_single_range_with_eab_feature(self):
         # Arrange
         self.buffered_display = _create_buffered_display(self.interface, has_eab=True)
 
-        self.buffered_display.write = Mock(wraps=self.buffered_display.write)
+        self.buffered_display.write = _LastCallSpy(self.buffered_display.write)
 
         self.assertFalse(self.buffered_display.dirty)
 
@@ -543,146 +582,127 @@ class BufferedDisplayFlushTestCase(unittest.TestCase):
         self.assertTrue(self.buffered_display.flush())
 
         self.assertFalse(self.buffered_display.dirty)
-        self.assertEqual(self.buffered_display.regen_buffer[80:83], bytes.fromhex('01 02 03'))
-        self.assertEqual(self.buffered_display.eab_buffer[80:83], bytes.fromhex('11 12 13'))
+        self.assertEqual(self.buffered_display.regen_buffer[80:83], B123)
+        self.assertEqual(self.buffered_display.eab_buffer[80:83], B111213)
 
-        self.buffered_display.write.assert_called_with(bytes.fromhex('01 02 03'), bytes.fromhex('11 12 13'), address=80)
+        self.buffered_display.write.assert_called_with(B123, B111213, address=80)
 
     def test_multiple_ranges_with_no_eab_feature(self):
         # Arrange
         self.assertFalse(self.buffered_display.dirty)
 
-        self.buffered_display.buffered_write_byte(0x01, None, address=80)
-        self.buffered_display.buffered_write_byte(0x02, None, address=81)
-        self.buffered_display.buffered_write_byte(0x03, None, address=82)
-        self.buffered_display.buffered_write_byte(0x05, None, address=110)
-        self.buffered_display.buffered_write_byte(0x06, None, address=111)
-        self.buffered_display.buffered_write_byte(0x07, None, address=112)
-        self.buffered_display.buffered_write_byte(0x04, None, address=100)
+        self._seed_multiple_ranges()
 
         # Act and assert
         self.assertTrue(self.buffered_display.flush())
 
         self.assertFalse(self.buffered_display.dirty)
-        self.assertEqual(self.buffered_display.regen_buffer[80:83], bytes.fromhex('01 02 03'))
-        self.assertEqual(self.buffered_display.regen_buffer[100:101], bytes.fromhex('04'))
-        self.assertEqual(self.buffered_display.regen_buffer[110:113], bytes.fromhex('05 06 07'))
+        self.assertEqual(self.buffered_display.regen_buffer[80:113], EXPECTED_REGEN_MULTI)
 
-        self.buffered_display.write.assert_called_with(bytes.fromhex('01 02 03 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 04 00 00 00 00 00 00 00 00 00 05 06 07'), None, address=80)
+        self.buffered_display.write.assert_called_with(EXPECTED_REGEN_MULTI, None, address=80)
 
     def test_multiple_ranges_with_eab_feature(self):
         # Arrange
         self.buffered_display = _create_buffered_display(self.interface, has_eab=True)
 
-        self.buffered_display.write = Mock(wraps=self.buffered_display.write)
+        self.buffered_display.write = _LastCallSpy(self.buffered_display.write)
 
         self.assertFalse(self.buffered_display.dirty)
 
-        self.buffered_display.buffered_write_byte(0x01, 0x11, address=80)
-        self.buffered_display.buffered_write_byte(0x02, 0x12, address=81)
-        self.buffered_display.buffered_write_byte(0x03, 0x13, address=82)
-        self.buffered_display.buffered_write_byte(0x05, 0x15, address=110)
-        self.buffered_display.buffered_write_byte(0x06, 0x16, address=111)
-        self.buffered_display.buffered_write_byte(0x07, 0x17, address=112)
-        self.buffered_display.buffered_write_byte(0x04, 0x14, address=100)
+        self._seed_multiple_ranges()
 
         # Act and assert
         self.assertTrue(self.buffered_display.flush())
 
         self.assertFalse(self.buffered_display.dirty)
-        self.assertEqual(self.buffered_display.regen_buffer[80:83], bytes.fromhex('01 02 03'))
-        self.assertEqual(self.buffered_display.regen_buffer[100:101], bytes.fromhex('04'))
-        self.assertEqual(self.buffered_display.regen_buffer[110:113], bytes.fromhex('05 06 07'))
-        self.assertEqual(self.buffered_display.eab_buffer[80:83], bytes.fromhex('11 12 13'))
-        self.assertEqual(self.buffered_display.eab_buffer[100:101], bytes.fromhex('14'))
-        self.assertEqual(self.buffered_display.eab_buffer[110:113], bytes.fromhex('15 16 17'))
+        self.assertEqual(self.buffered_display.regen_buffer[80:113], EXPECTED_REGEN_MULTI)
+        self.assertEqual(self.buffered_display.eab_buffer[80:113], EXPECTED_EAB_MULTI)
 
-        self.buffered_display.write.assert_called_with(bytes.fromhex('01 02 03 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 04 00 00 00 00 00 00 00 00 00 05 06 07'), bytes.fromhex('11 12 13 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 14 00 00 00 00 00 00 00 00 00 15 16 17'), address=80)
+        self.buffered_display.write.assert_called_with(EXPECTED_REGEN_MULTI, EXPECTED_EAB_MULTI, address=80)
 
-class BufferedDisplayClearTestCase(unittest.TestCase):
-    def setUp(self):
-        self.interface = MockInterface()
+    def test_multiple_ranges_exceeding_merge_gap(self):
+        # Arrange
+        write_calls = []
+        write = self.buffered_display.write.function
 
-        self.buffered_display = _create_buffered_display(self.interface)
+        def record_write(*args, **kwargs):
+            write_calls.append(call(*args, **kwargs))
 
-        self.buffered_display.write = Mock(wraps=self.buffered_display.write)
-        self.buffered_display._load_address_counter = Mock(wraps=self.buffered_display._load_address_counter)
+            return write(*args, **kwargs)
 
-    def test_excluding_status_line_with_no_eab_feature(self):
-        # Arrange
-        self.buffered_display.buffered_write_byte(0x01, None, address=80)
-
-        self.assertTrue(self.buffered_display.dirty)
+        self.buffered_display.write = record_write
 
-        # Act
-        self.buffered_display.clear(clear_status_line=False)
+        self.buffered_display.buffered_write_byte(0x01, None, address=80)
+        self.buffered_display.buffered_write_byte(0x02, None, address=160)
 
-        # Assert
-        self.buffered_display.write.assert_called_with((b'\x00', 1920), None, address=80)
-        self.buffered_display._load_address_counter.assert_called_with(80, True)
+        # Act and assert
+        self.assertTrue(self.buffered_display.flush())
 
-        self.assertTrue(all(byte == 0x00 for byte in self.buffered_display.regen_buffer))
         self.assertFalse(self.buffered_display.dirty)
 
-    def test_excluding_status_line_with_eab_feature(self):
-        # Arrange
-        self.buffered_display = _create_buffered_display(self.interface, has_eab=True)
-
-        self.buffered_display.write = Mock(wraps=self.buffered_display.write)
-        self.buffered_display._load_address_counter = Mock(wraps=self.buffered_display._load_address_counter)
+        self.assertEqual(write_calls, [call(b'\x01', None, address=80), call(b'\x02', None, address=160)])
 
-        self.buffered_display.buffered_write_byte(0x01, 0x02, address=80)
+    def test_multiple_ranges_executed_together(self):
+        # Arrange
+        self.buffered_display.buffered_write_byte(0x01, None, address=80)
+        self.buffered_display.buffered_write_byte(0x02, None, address=160)
 
-        self.assertTrue(self.buffered_display.dirty)
+        self.interface.reset_mock()
 
-        # Act
-        self.buffered_display.clear(clear_status_line=False)
+        # Act and assert
+        self.assertTrue(self.buffered_display.flush())
 
-        # Assert
-        self.buffered_display.write.assert_called_with((b'\x00', 1920), (b'\x00', 1920), address=80)
-        self.buffered_display._load_address_counter.assert_called_with(80, True)
+        self.assertEqual(self.interface._execute.call_count, 1)
 
-        self.assertTrue(all(byte == 0x00 for byte in self.buffered_display.regen_buffer))
-        self.assertTrue(all(byte == 0x00 for byte in self.buffered_display.eab_buffer))
-        self.assertFalse(self.buffered_display.dirty)
+        self.interface.assert_command_executed(None, LoadAddressCounterLo, lambda command: command.address == 80)
+        self.interface.assert_command_executed(None, LoadAddressCounterLo, lambda command: command.address == 160)
 
-    def test_including_status_line_with_no_eab_feature(self):
+    def test_write_error(self):
         # Arrange
         self.buffered_display.buffered_write_byte(0x01, None, address=80)
+        self.buffered_display.buffered_write_byte(0x02, None, address=160)
 
-        self.assertTrue(self.buffered_display.dirty)
+        self.buffered_display.address_counter = 80
 
-        # Act
-        self.buffered_display.clear(clear_status_line=True)
+        self.interface.mock_responses = [(None, WriteData, None, ProtocolError)]
 
-        # Assert
-        self.buffered_display.write.assert_called_with((b'\x00', 2000), None, address=0)
-        self.buffered_display._load_address_counter.assert_called_with(80, True)
+        # Act and assert
+        self.assertTrue(self.buffered_display.flush())
+
+        self.assertEqual(self.buffered_display.dirty, [80, 160])
+
+        self.assertIsNone(self.buffered_display.address_counter)
+
+    def test_repeated_byte_range(self):
+        # Arrange
+        for address in range(80, 100):
+            self.buffered_display.buffered_write_byte(0x01, None, address=address)
+
+        # Act and assert
+        self.assertTrue(self.buffered_display.flush())
 
-        self.assertTrue(all(byte == 0x00 for byte in self.buffered_display.regen_buffer))
         self.assertFalse(self.buffered_display.dirty)
 
-    def test_including_status_line_with_eab_feature(self):
+        self.buffered_display.write.assert_called_with((b'\x01', 20), None, address=80)
+
+    def test_repeated_byte_range_with_eab_feature(self):
         # Arrange
         self.buffered_display = _create_buffered_display(self.interface, has_eab=True)
 
-        self.buffered_display.write = Mock(wraps=self.buffered_display.write)
-        self.buffered_display._load_address_counter = Mock(wraps=self.buffered_display._load_address_counter)
+        self.buffered_display.write = _LastCallSpy(self.buffered_display.write)
 
-        self.buffered_display.buffered_write_byte(0x01, 0x02, address=80)
+        for address in range(80, 100):
+            self.buffered_display.buffered_write_byte(0x01, 0x11 if address < 90 else 0x12, address=address)
 
-        self.assertTrue(self.buffered_display.dirty)
+        # Act and assert
+        self.assertTrue(self.buffered_display.flush())
 
-        # Act
-        self.buffered_display.clear(clear_status_line=True)
+        self.buffered_display.write.assert_called_with(bytes.fromhex('01') * 20, bytes.fromhex('11') * 10 + bytes.fromhex('12') * 10, address=80)
 
-        # Assert
-        self.buffered_display.write.assert_called_with((b'\x00', 2000), (b'\x00', 2000), address=0)
-        self.buffered_display._load_address_counter.assert_called_with(80, True)
+    def _seed_multiple_ranges(self):
+        eab_data = EXPECTED_EAB_MULTI if self.buffered_display.has_eab else None
 
-        self.assertTrue(all(byte == 0x00 for byte in self.buffered_display.regen_buffer))
-        self.assertTrue(all(byte == 0x00 for byte in self.buffered_display.eab_buffer))
-        self.assertFalse(self.buffered_display.dirty)
+        self.buffered_display.buffered_write(EXPECTED_REGEN_MULTI, eab_data, address=80)
 
 class BufferedDisplayWriteTestCase(unittest.TestCase):
     def setUp(self):
@@ -690,10 +710,7 @@ class BufferedDisplayWriteTestCase(unittest.TestCase):
 
         self.buffered_display = _create_buffered_display(self.interface)
 
-        self.buffered_display._read_address_counter = Mock(wraps=self.buffered_display._read_address_counter)
-        self.buffered_display._load_address_counter = Mock(wraps=self.buffered_display._load_address_counter)
-        self.buffered_display._write_data = Mock(wraps=self.buffered_display._write_data)
-        self.buffered_display._eab_write_alternate = Mock(wraps=self.buffered_display._eab_write_alternate)
+        _wrap_write_methods(self.buffered_display)
 
     def test_if_current_address_unknown(self):
         # Arrange
@@ -705,12 +722,12 @@ class BufferedDisplayWriteTestCase(unittest.TestCase):
         ]
 
         # Act
-        self.buffered_display.write(bytes.fromhex('01 02 03'), None)
+        self.buffered_display.write(B123, None)
 
         # Assert
         self.assertEqual(self.buffered_display.address_counter, 163)
 
-        self.assertEqual(self.buffered_display.regen_buffer[160:163], bytes.fromhex('01 02 03'))
+        self.assertEqual(self.buffered_display.regen_buffer[160:163], B123)
 
         self.buffered_display._read_address_counter.assert_called()
         self.buffered_display._load_address_counter.assert_not_called()
@@ -720,12 +737,12 @@ class BufferedDisplayWriteTestCase(unittest.TestCase):
         self.assertIsNone(self.buffered_display.address_counter)
 
         # Act
-        self.buffered_display.write(bytes.fromhex('01 02 03'), None, address=80)
+        self.buffered_display.write(B123, None, address=80)
 
         # Assert
         self.assertEqual(self.buffered_display.address_counter, 83)
 
-        self.assertEqual(self.buffered_display.regen_buffer[80:83], bytes.fromhex('01 02 03'))
+        self.assertEqual(self.buffered_display.regen_buffer[80:83], B123)
 
         self.buffered_display._read_address_counter.assert_not_called()
         self.buffered_display._load_address_counter.assert_called_with(80, force_load=False)
@@ -735,64 +752,58 @@ class BufferedDisplayWriteTestCase(unittest.TestCase):
         self.buffered_display.address_counter = 80
 
         # Act
-        self.buffered_display.write(bytes.fromhex('01 02 03'), None)
+        self.buffered_display.write(B123, None)
 
         # Assert
-        self.assertEqual(self.buffered_display.regen_buffer[80:83], bytes.fromhex('01 02 03'))
+        self.assertEqual(self.buffered_display.regen_buffer[80:83], B123)
 
-        self.buffered_display._write_data.assert_called_with(bytes.fromhex('01 02 03'))
+        self.buffered_display._write_data.assert_called_with(B123)
 
     def test_regen_only_repeat(self):
         # Arrange
         self.buffered_display.address_counter = 80
 
         # Act
-        self.buffered_display.write((bytes.fromhex('01 02 03'), 2), None)
+        self.buffered_display.write((B123, 2), None)
 
         # Assert
-        self.assertEqual(self.buffered_display.regen_buffer[80:86], bytes.fromhex('01 02 03 01 02 03'))
+        self.assertEqual(self.buffered_display.regen_buffer[80:86], B123 + B123)
 
-        self.buffered_display._write_data.assert_called_with((bytes.fromhex('01 02 03'), 2))
+        self.buffered_display._write_data.assert_called_with((B123, 2))
 
     def test_regen_eab(self):
         # Arrange
         self.buffered_display = _create_buffered_display(self.interface, has_eab=True)
 
-        self.buffered_display._read_address_counter = Mock(wraps=self.buffered_display._read_address_counter)
-        self.buffered_display._load_address_counter = Mock(wraps=self.buffered_display._load_address_counter)
-        self.buffered_display._write_data = Mock(wraps=self.buffered_display._write_data)
-        self.buffered_display._eab_write_alternate = Mock(wraps=self.buffered_display._eab_write_alternate)
+        _wrap_write_methods(self.buffered_display)
 
         self.buffered_display.address_counter = 80
 
         # Act
-        self.buffered_display.write(bytes.fromhex('01 02 03'), bytes.fromhex('04 05 06'))
+        self.buffered_display.write(B123, B456)
 
         # Assert
-        self.assertEqual(self.buffered_display.regen_buffer[80:83], bytes.fromhex('01 02 03'))
-        self.assertEqual(self.buffered_display.eab_buffer[80:83], bytes.fromhex('04 05 06'))
+        self.assertEqual(self.buffered_display.regen_buffer[80:83], B123)
+        self.assertEqual(self.buffered_display.eab_buffer[80:83], B456)
 
-        self.buffered_display._eab_write_alternate.assert_called_with(bytes.fromhex('01 04 02 05 03 06'))
+        self.buffered_display._eab_write_alternate.assert_called_with(B142536)
 
     def test_regen_eab_repeat(self):
         # Arrange
         self.buffered_display = _create_buffered_display(self.interface, has_eab=True)
 
-        self.buffered_display._read_address_counter = Mock(wraps=self.buffered_display._read_address_counter)
-        self.buffered_display._load_address_counter = Mock(wraps=self.buffered_display._load_address_counter)
-        self.buffered_display._write_data = Mock(wraps=self.buffered_display._write_data)
-        self.buffered_display._eab_write_alternate = Mock(wraps=self.buffered_display._eab_write_alternate)
+        _wrap_write_methods(self.buffered_display)
 
         self.buffered_display.address_counter = 80
 
         # Act
-        self.buffered_display.write((bytes.fromhex('01 02 03'), 2), (bytes.fromhex('04 05 06'), 2))
+        self.buffered_display.write((B123, 2), (B456, 2))
 
         # Assert
-        self.assertEqual(self.buffered_display.regen_buffer[80:86], bytes.fromhex('01 02 03 01 02 03'))
-        self.assertEqual(self.buffered_display.eab_buffer[80:86], bytes.fromhex('04 05 06 04 05 06'))
+        self.assertEqual(self.buffered_display.regen_buffer[80:86], B123 + B123)
+        self.assertEqual(self.buffered_display.eab_buffer[80:86], B456 + B456)
 
-        self.buffered_display._eab_write_alternate.assert_called_with((bytes.fromhex('01 04 02 05 03 06'), 2))
+        self.buffered_display._eab_write_alternate.assert_called_with((B142536, 2))
 
     def test_dirty_cleared(self):
         # Arrange
@@ -802,15 +813,15 @@ class BufferedDisplayWriteTestCase(unittest.TestCase):
         self.buffered_display.buffered_write_byte(0x02, None, address=81)
         self.buffered_display.buffered_write_byte(0x03, None, address=82)
 
-        self.assertSequenceEqual(self.buffered_display.dirty, [80, 81, 82])
+        self.assertEqual(self.buffered_display.dirty, [80, 81, 82])
 
         # Act
         self.buffered_display.write(bytes.fromhex('02 03'), None)
 
         # Assert
-        self.assertEqual(self.buffered_display.regen_buffer[80:83], bytes.fromhex('01 02 03'))
+        self.assertEqual(self.buffered_display.regen_buffer[80:83], B123)
 
-        self.assertSequenceEqual(self.buffered_display.dirty, [80])
+        self.assertEqual(self.buffered_display.dirty, [80])
 
 class EncodeCharacterTestCase(unittest.TestCase):
     def test_mapped_character(self):
@@ -829,10 +840,10 @@ class EncodeStringTestCase(unittest.TestCase):
     def test_unmapped_characters(self):
         self.assertEqual(encode_string('Everything ✓'), bytes.fromhex('a4 95 84 91 98 93 87 88 8d 86 00 00'))
 
-def _create_display(interface):
+def _create_display(interface, has_eab=False):
     terminal_id = TerminalId(0b11110100)
     extended_id = 'c1348300'
-    features = { }
+    features = { Feature.EAB: 7 } if has_eab else { }
     keymap = KEYMAP
 
     terminal = Terminal(InterfaceWrapper(interface), None, terminal_id, extended_id, features, keymap)
@@ -852,3 +863,43 @@ def _create_buffered_display(interface, has_eab=False):
     buffered_display = BufferedDisplay(terminal, terminal.display.dimensions, features.get(Feature.EAB))
 
     return buffered_display
+
+def _wrap_write_methods(display, names=None):
+    if names is None:
+        names = ['_read_address_counter', '_load_address_counter', '_write_data', '_eab_write_alternate']
+
+    # Wrap the write path methods so calls can be asserted.
+    for name in names:
+        setattr(display, name, _LastCallSpy(getattr(display, name)))
+
+class _LastCallSpy:
+    """Record the last call to a function."""
+
+    __slots__ = ('function', 'last_call', 'call_count')
+
+    def __init__(self, function):
+        self.function = function
+        self.last_call = None
+        self.call_count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.last_call = (args, kwargs)
+        self.call_count += 1
+
+        return self.function(*args, **kwargs)
+
+    def assert_called_with(self, *args, **kwargs):
+        if self.last_call != (args, kwargs):
+            raise AssertionError(f'Expected last call {(args, kwargs)}, got {self.last_call}')
+
+    def assert_called(self):
+        if self.call_count == 0:
+            raise AssertionError('Expected to be called')
+
+    def assert_called_once(self):
+        if self.call_count != 1:
+            raise AssertionError(f'Expected to be called once, called {self.call_count} times')
+
+    def assert_not_called(self):
+        if self.last_call is not None:
+            raise AssertionError('Expected not to be called')
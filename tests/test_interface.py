@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import patch, DEFAULT
 
 from coax import ReadAddressCounterHi, ReadAddressCounterLo, ProtocolError
 
@@ -10,18 +10,22 @@ from oec.interface import InterfaceWrapper, ExecuteError
 from mock_interface import MockInterface
 
 class InterfaceWrapperInitTestCase(unittest.TestCase):
-    def setUp(self):
-        self.interface = MockInterface()
+    @classmethod
+    def setUpClass(cls):
+        patcher = patch.multiple('oec.interface', _get_jumbo_write_strategy=DEFAULT, _print_i1_jumbo_write_notice=DEFAULT)
 
-        patcher = patch('oec.interface._get_jumbo_write_strategy')
+        mocks = patcher.start()
 
-        self.get_jumbo_write_strategy = patcher.start()
+        cls.get_jumbo_write_strategy = mocks['_get_jumbo_write_strategy']
+        cls.print_i1_jumbo_write_notice = mocks['_print_i1_jumbo_write_notice']
 
-        patcher = patch('oec.interface._print_i1_jumbo_write_notice')
+        cls.addClassCleanup(patcher.stop)
 
-        self.print_i1_jumbo_write_notice = patcher.start()
+    def setUp(self):
+        self.interface = MockInterface()
 
-        self.addCleanup(patch.stopall)
+        self.get_jumbo_write_strategy.reset_mock(return_value=True, side_effect=True)
+        self.print_i1_jumbo_write_notice.reset_mock(return_value=True, side_effect=True)
 
     def test_no_jumbo_write_strategy(self):
         # Arrange
@@ -52,10 +56,16 @@ class InterfaceWrapperInitTestCase(unittest.TestCase):
         self.print_i1_jumbo_write_notice.assert_called()
 
 class InterfaceWrapperExecuteTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.interface = MockInterface()
+
+        cls.interface_wrapper = InterfaceWrapper(cls.interface)
+
     def setUp(self):
-        self.interface = MockInterface()
+        self.interface.mock_responses = []
 
-        self.interface_wrapper = InterfaceWrapper(self.interface)
+        self.interface.reset_mock()
 
     def test_single_command(self):
         # Arrange
@@ -69,7 +79,7 @@ class InterfaceWrapperExecuteTestCase(unittest.TestCase):
 
     def test_single_command_that_raises_error(self):
         # Arrange
-        self.interface.mock_responses = [(None, ReadAddressCounterHi, None, Mock(side_effect=ProtocolError))]
+        self.interface.mock_responses = [(None, ReadAddressCounterHi, None, ProtocolError)]
 
         # Act and assert
         with self.assertRaises(ProtocolError):
@@ -88,11 +98,13 @@ class InterfaceWrapperExecuteTestCase(unittest.TestCase):
         # Assert
         self.assertEqual(responses, [0x00, 0xff])
 
+        self.assertEqual(self.interface._execute.call_count, 1)
+
     def test_multiple_commands_that_returns_error(self):
         # Arrange
         self.interface.mock_responses = [
             (None, ReadAddressCounterHi, None, 0x00),
-            (None, ReadAddressCounterLo, None, Mock(side_effect=ProtocolError))
+            (None, ReadAddressCounterLo, None, ProtocolError)
         ]
 
         # Act and assert
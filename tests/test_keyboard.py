@@ -6,9 +6,14 @@ from oec.keyboard import KeyboardModifiers, Key, Keymap, Keyboard, get_character
 from oec.keymap_3278_typewriter import KEYMAP as KEYMAP_3278_TYPEWRITER
 from oec.keymap_ibm_typewriter import KEYMAP as KEYMAP_IBM_TYPEWRITER
 
+# Modifier combinations used by the get_key sequences.
+LEFT_AND_RIGHT_SHIFT = KeyboardModifiers.LEFT_SHIFT | KeyboardModifiers.RIGHT_SHIFT
+RIGHT_ALT_AND_LEFT_SHIFT = KeyboardModifiers.RIGHT_ALT | KeyboardModifiers.LEFT_SHIFT
+CAPS_LOCK_AND_LEFT_SHIFT = KeyboardModifiers.CAPS_LOCK | KeyboardModifiers.LEFT_SHIFT
+
 class KeyboardModifiersTestCase(unittest.TestCase):
     def test_is_shift(self):
-        for modifiers in [KeyboardModifiers.LEFT_SHIFT, KeyboardModifiers.RIGHT_SHIFT, KeyboardModifiers.LEFT_SHIFT | KeyboardModifiers.RIGHT_SHIFT, KeyboardModifiers.LEFT_SHIFT | KeyboardModifiers.LEFT_ALT, KeyboardModifiers.RIGHT_SHIFT | KeyboardModifiers.CAPS_LOCK]:
+        for modifiers in [KeyboardModifiers.LEFT_SHIFT, KeyboardModifiers.RIGHT_SHIFT, LEFT_AND_RIGHT_SHIFT, KeyboardModifiers.LEFT_SHIFT | KeyboardModifiers.LEFT_ALT, KeyboardModifiers.RIGHT_SHIFT | KeyboardModifiers.CAPS_LOCK]:
             with self.subTest(modifiers=input):
                 self.assertTrue(modifiers.is_shift())
 
@@ -28,7 +33,7 @@ class KeyboardModifiersTestCase(unittest.TestCase):
                 self.assertFalse(modifiers.is_alt())
 
     def test_is_caps_lock(self):
-        for modifiers in [KeyboardModifiers.CAPS_LOCK, KeyboardModifiers.CAPS_LOCK | KeyboardModifiers.LEFT_SHIFT, KeyboardModifiers.CAPS_LOCK | KeyboardModifiers.LEFT_ALT]:
+        for modifiers in [KeyboardModifiers.CAPS_LOCK, CAPS_LOCK_AND_LEFT_SHIFT, KeyboardModifiers.CAPS_LOCK | KeyboardModifiers.LEFT_ALT]:
             with self.subTest(modifiers=input):
                 self.assertTrue(modifiers.is_caps_lock())
 
@@ -45,84 +50,102 @@ class KeyboardGetKeySingleModifierReleaseTestCase(unittest.TestCase):
         self.assertTrue(self.keyboard.single_modifier_release)
 
     def test_default(self):
-        self._assert_get_key(28, Key.LOWER_A, KeyboardModifiers.NONE, False)
-        self._assert_get_key(50, Key.LOWER_B, KeyboardModifiers.NONE, False)
-        self._assert_get_key(33, Key.LOWER_C, KeyboardModifiers.NONE, False)
-        self._assert_get_key(35, Key.LOWER_D, KeyboardModifiers.NONE, False)
+        self._assert_get_keys([
+            (28, Key.LOWER_A, KeyboardModifiers.NONE, False),
+            (50, Key.LOWER_B, KeyboardModifiers.NONE, False),
+            (33, Key.LOWER_C, KeyboardModifiers.NONE, False),
+            (35, Key.LOWER_D, KeyboardModifiers.NONE, False)
+        ])
 
     def test_shift(self):
-        self._assert_get_key(28, Key.LOWER_A, KeyboardModifiers.NONE, False)
-        self._assert_get_key(18, Key.LEFT_SHIFT, KeyboardModifiers.LEFT_SHIFT, True)
-        self._assert_get_key(50, Key.UPPER_B, KeyboardModifiers.LEFT_SHIFT, False)
-        self._assert_get_key(89, Key.RIGHT_SHIFT, KeyboardModifiers.LEFT_SHIFT | KeyboardModifiers.RIGHT_SHIFT, True)
-        self._assert_get_key(33, Key.UPPER_C, KeyboardModifiers.LEFT_SHIFT | KeyboardModifiers.RIGHT_SHIFT, False)
-        self._assert_get_key(240, None, KeyboardModifiers.LEFT_SHIFT | KeyboardModifiers.RIGHT_SHIFT, False)
-        self._assert_get_key(18, None, KeyboardModifiers.RIGHT_SHIFT, True)
-        self._assert_get_key(35, Key.UPPER_D, KeyboardModifiers.RIGHT_SHIFT, False)
-        self._assert_get_key(240, None, KeyboardModifiers.RIGHT_SHIFT, False)
-        self._assert_get_key(89, None, KeyboardModifiers.NONE, True)
-        self._assert_get_key(36, Key.LOWER_E, KeyboardModifiers.NONE, False)
+        self._assert_get_keys([
+            (28, Key.LOWER_A, KeyboardModifiers.NONE, False),
+            (18, Key.LEFT_SHIFT, KeyboardModifiers.LEFT_SHIFT, True),
+            (50, Key.UPPER_B, KeyboardModifiers.LEFT_SHIFT, False),
+            (89, Key.RIGHT_SHIFT, LEFT_AND_RIGHT_SHIFT, True),
+            (33, Key.UPPER_C, LEFT_AND_RIGHT_SHIFT, False),
+            (240, None, LEFT_AND_RIGHT_SHIFT, False),
+            (18, None, KeyboardModifiers.RIGHT_SHIFT, True),
+            (35, Key.UPPER_D, KeyboardModifiers.RIGHT_SHIFT, False),
+            (240, None, KeyboardModifiers.RIGHT_SHIFT, False),
+            (89, None, KeyboardModifiers.NONE, True),
+            (36, Key.LOWER_E, KeyboardModifiers.NONE, False)
+        ])
 
     # TODO... include the additional ALT reset scan_code!
 
     def test_mapped_alt(self):
-        self._assert_get_key(28, Key.LOWER_A, KeyboardModifiers.NONE, False)
-        self._assert_get_key(57, Key.RIGHT_ALT, KeyboardModifiers.RIGHT_ALT, True)
-        self._assert_get_key(50, Key.LOWER_B, KeyboardModifiers.RIGHT_ALT, False)
-        self._assert_get_key(240, None, KeyboardModifiers.RIGHT_ALT, False)
-        self._assert_get_key(57, None, KeyboardModifiers.NONE, True)
-        self._assert_get_key(33, Key.LOWER_C, KeyboardModifiers.NONE, False)
+        self._assert_get_keys([
+            (28, Key.LOWER_A, KeyboardModifiers.NONE, False),
+            (57, Key.RIGHT_ALT, KeyboardModifiers.RIGHT_ALT, True),
+            (50, Key.LOWER_B, KeyboardModifiers.RIGHT_ALT, False),
+            (240, None, KeyboardModifiers.RIGHT_ALT, False),
+            (57, None, KeyboardModifiers.NONE, True),
+            (33, Key.LOWER_C, KeyboardModifiers.NONE, False)
+        ])
 
     def test_unmapped_alt(self):
-        self._assert_get_key(28, Key.LOWER_A, KeyboardModifiers.NONE, False)
-        self._assert_get_key(57, Key.RIGHT_ALT, KeyboardModifiers.RIGHT_ALT, True)
-        self._assert_get_key(50, Key.LOWER_B, KeyboardModifiers.RIGHT_ALT, False)
-        self._assert_get_key(240, None, KeyboardModifiers.RIGHT_ALT, False)
-        self._assert_get_key(57, None, KeyboardModifiers.NONE, True)
-        self._assert_get_key(33, Key.LOWER_C, KeyboardModifiers.NONE, False)
+        self._assert_get_keys([
+            (28, Key.LOWER_A, KeyboardModifiers.NONE, False),
+            (57, Key.RIGHT_ALT, KeyboardModifiers.RIGHT_ALT, True),
+            (50, Key.LOWER_B, KeyboardModifiers.RIGHT_ALT, False),
+            (240, None, KeyboardModifiers.RIGHT_ALT, False),
+            (57, None, KeyboardModifiers.NONE, True),
+            (33, Key.LOWER_C, KeyboardModifiers.NONE, False)
+        ])
 
     def test_alt_and_shift(self):
-        self._assert_get_key(28, Key.LOWER_A, KeyboardModifiers.NONE, False)
-        self._assert_get_key(57, Key.RIGHT_ALT, KeyboardModifiers.RIGHT_ALT, True)
-        self._assert_get_key(50, Key.LOWER_B, KeyboardModifiers.RIGHT_ALT, False)
-        self._assert_get_key(18, Key.LEFT_SHIFT, KeyboardModifiers.RIGHT_ALT | KeyboardModifiers.LEFT_SHIFT, True)
-        self._assert_get_key(33, Key.UPPER_C, KeyboardModifiers.RIGHT_ALT | KeyboardModifiers.LEFT_SHIFT, False)
-        self._assert_get_key(240, None, KeyboardModifiers.RIGHT_ALT | KeyboardModifiers.LEFT_SHIFT, False)
-        self._assert_get_key(18, None, KeyboardModifiers.RIGHT_ALT, True)
-        self._assert_get_key(35, Key.LOWER_D, KeyboardModifiers.RIGHT_ALT, False)
-        self._assert_get_key(240, None, KeyboardModifiers.RIGHT_ALT, False)
-        self._assert_get_key(57, None, KeyboardModifiers.NONE, True)
-        self._assert_get_key(36, Key.LOWER_E, KeyboardModifiers.NONE, False)
+        self._assert_get_keys([
+            (28, Key.LOWER_A, KeyboardModifiers.NONE, False),
+            (57, Key.RIGHT_ALT, KeyboardModifiers.RIGHT_ALT, True),
+            (50, Key.LOWER_B, KeyboardModifiers.RIGHT_ALT, False),
+            (18, Key.LEFT_SHIFT, RIGHT_ALT_AND_LEFT_SHIFT, True),
+            (33, Key.UPPER_C, RIGHT_ALT_AND_LEFT_SHIFT, False),
+            (240, None, RIGHT_ALT_AND_LEFT_SHIFT, False),
+            (18, None, KeyboardModifiers.RIGHT_ALT, True),
+            (35, Key.LOWER_D, KeyboardModifiers.RIGHT_ALT, False),
+            (240, None, KeyboardModifiers.RIGHT_ALT, False),
+            (57, None, KeyboardModifiers.NONE, True),
+            (36, Key.LOWER_E, KeyboardModifiers.NONE, False)
+        ])
 
     def test_caps_lock(self):
-        self._assert_get_key(28, Key.LOWER_A, KeyboardModifiers.NONE, False)
-        self._assert_get_key(20, Key.CAPS_LOCK, KeyboardModifiers.CAPS_LOCK, True)
-        self._assert_get_key(240, None, KeyboardModifiers.CAPS_LOCK, False)
-        self._assert_get_key(20, None, KeyboardModifiers.CAPS_LOCK, False)
-        self._assert_get_key(50, Key.UPPER_B, KeyboardModifiers.CAPS_LOCK, False)
-        self._assert_get_key(20, Key.CAPS_LOCK, KeyboardModifiers.NONE, True)
-        self._assert_get_key(240, None, KeyboardModifiers.NONE, False)
-        self._assert_get_key(20, None, KeyboardModifiers.NONE, False)
-        self._assert_get_key(33, Key.LOWER_C, KeyboardModifiers.NONE, False)
+        self._assert_get_keys([
+            (28, Key.LOWER_A, KeyboardModifiers.NONE, False),
+            (20, Key.CAPS_LOCK, KeyboardModifiers.CAPS_LOCK, True),
+            (240, None, KeyboardModifiers.CAPS_LOCK, False),
+            (20, None, KeyboardModifiers.CAPS_LOCK, False),
+            (50, Key.UPPER_B, KeyboardModifiers.CAPS_LOCK, False),
+            (20, Key.CAPS_LOCK, KeyboardModifiers.NONE, True),
+            (240, None, KeyboardModifiers.NONE, False),
+            (20, None, KeyboardModifiers.NONE, False),
+            (33, Key.LOWER_C, KeyboardModifiers.NONE, False)
+        ])
 
     def test_caps_lock_and_shift(self):
-        self._assert_get_key(28, Key.LOWER_A, KeyboardModifiers.NONE, False)
-        self._assert_get_key(20, Key.CAPS_LOCK, KeyboardModifiers.CAPS_LOCK, True)
-        self._assert_get_key(240, None, KeyboardModifiers.CAPS_LOCK, False)
-        self._assert_get_key(20, None, KeyboardModifiers.CAPS_LOCK, False)
-        self._assert_get_key(50, Key.UPPER_B, KeyboardModifiers.CAPS_LOCK, False)
-        self._assert_get_key(18, Key.LEFT_SHIFT, KeyboardModifiers.CAPS_LOCK | KeyboardModifiers.LEFT_SHIFT, True)
-        self._assert_get_key(33, Key.LOWER_C, KeyboardModifiers.CAPS_LOCK | KeyboardModifiers.LEFT_SHIFT, False)
-        self._assert_get_key(240, None, KeyboardModifiers.CAPS_LOCK | KeyboardModifiers.LEFT_SHIFT, False)
-        self._assert_get_key(18, None, KeyboardModifiers.CAPS_LOCK, True)
-        self._assert_get_key(35, Key.UPPER_D, KeyboardModifiers.CAPS_LOCK, False)
-        self._assert_get_key(20, Key.CAPS_LOCK, KeyboardModifiers.NONE, True)
-        self._assert_get_key(240, None, KeyboardModifiers.NONE, False)
-        self._assert_get_key(20, None, KeyboardModifiers.NONE, False)
-        self._assert_get_key(36, Key.LOWER_E, KeyboardModifiers.NONE, False)
-
-    def _assert_get_key(self, scan_code, key, modifiers, modifiers_changed):
-        self.assertEqual(self.keyboard.get_key(scan_code), (key, modifiers, modifiers_changed))
+        self._assert_get_keys([
+            (28, Key.LOWER_A, KeyboardModifiers.NONE, False),
+            (20, Key.CAPS_LOCK, KeyboardModifiers.CAPS_LOCK, True),
+            (240, None, KeyboardModifiers.CAPS_LOCK, False),
+            (20, None, KeyboardModifiers.CAPS_LOCK, False),
+            (50, Key.UPPER_B, KeyboardModifiers.CAPS_LOCK, False),
+            (18, Key.LEFT_SHIFT, CAPS_LOCK_AND_LEFT_SHIFT, True),
+            (33, Key.LOWER_C, CAPS_LOCK_AND_LEFT_SHIFT, False),
+            (240, None, CAPS_LOCK_AND_LEFT_SHIFT, False),
+            (18, None, KeyboardModifiers.CAPS_LOCK, True),
+            (35, Key.UPPER_D, KeyboardModifiers.CAPS_LOCK, False),
+            (20, Key.CAPS_LOCK, KeyboardModifiers.NONE, True),
+            (240, None, KeyboardModifiers.NONE, False),
+            (20, None, KeyboardModifiers.NONE, False),
+            (36, Key.LOWER_E, KeyboardModifiers.NONE, False)
+        ])
+
+    def _assert_get_keys(self, sequence):
+        get_key = self.keyboard.get_key
+
+        # Compare the whole sequence at once, each expected result is the key, modifiers
+        # and whether the modifiers changed.
+        self.assertEqual([get_key(scan_code) for (scan_code, *_) in sequence], [tuple(expected) for (_, *expected) in sequence])
 
 class KeyboardGetKeyMultipleModifierReleaseTestCase(unittest.TestCase):
     def setUp(self):
@@ -132,73 +155,91 @@ class KeyboardGetKeyMultipleModifierReleaseTestCase(unittest.TestCase):
         self.assertFalse(self.keyboard.single_modifier_release)
 
     def test_default(self):
-        self._assert_get_key(96, Key.LOWER_A, KeyboardModifiers.NONE, False)
-        self._assert_get_key(97, Key.LOWER_B, KeyboardModifiers.NONE, False)
-        self._assert_get_key(98, Key.LOWER_C, KeyboardModifiers.NONE, False)
-        self._assert_get_key(99, Key.LOWER_D, KeyboardModifiers.NONE, False)
+        self._assert_get_keys([
+            (96, Key.LOWER_A, KeyboardModifiers.NONE, False),
+            (97, Key.LOWER_B, KeyboardModifiers.NONE, False),
+            (98, Key.LOWER_C, KeyboardModifiers.NONE, False),
+            (99, Key.LOWER_D, KeyboardModifiers.NONE, False)
+        ])
 
     def test_shift(self):
-        self._assert_get_key(96, Key.LOWER_A, KeyboardModifiers.NONE, False)
-        self._assert_get_key(77, Key.LEFT_SHIFT, KeyboardModifiers.LEFT_SHIFT, True)
-        self._assert_get_key(97, Key.UPPER_B, KeyboardModifiers.LEFT_SHIFT, False)
-        self._assert_get_key(78, Key.RIGHT_SHIFT, KeyboardModifiers.LEFT_SHIFT | KeyboardModifiers.RIGHT_SHIFT, True)
-        self._assert_get_key(98, Key.UPPER_C, KeyboardModifiers.LEFT_SHIFT | KeyboardModifiers.RIGHT_SHIFT, False)
-        self._assert_get_key(205, None, KeyboardModifiers.RIGHT_SHIFT, True)
-        self._assert_get_key(99, Key.UPPER_D, KeyboardModifiers.RIGHT_SHIFT, False)
-        self._assert_get_key(206, None, KeyboardModifiers.NONE, True)
-        self._assert_get_key(100, Key.LOWER_E, KeyboardModifiers.NONE, False)
+        self._assert_get_keys([
+            (96, Key.LOWER_A, KeyboardModifiers.NONE, False),
+            (77, Key.LEFT_SHIFT, KeyboardModifiers.LEFT_SHIFT, True),
+            (97, Key.UPPER_B, KeyboardModifiers.LEFT_SHIFT, False),
+            (78, Key.RIGHT_SHIFT, LEFT_AND_RIGHT_SHIFT, True),
+            (98, Key.UPPER_C, LEFT_AND_RIGHT_SHIFT, False),
+            (205, None, KeyboardModifiers.RIGHT_SHIFT, True),
+            (99, Key.UPPER_D, KeyboardModifiers.RIGHT_SHIFT, False),
+            (206, None, KeyboardModifiers.NONE, True),
+            (100, Key.LOWER_E, KeyboardModifiers.NONE, False)
+        ])
 
     # TODO... include the additional ALT reset scan_code!
 
     def test_mapped_alt(self):
-        self._assert_get_key(96, Key.LOWER_A, KeyboardModifiers.NONE, False)
-        self._assert_get_key(79, Key.RIGHT_ALT, KeyboardModifiers.RIGHT_ALT, True)
-        self._assert_get_key(33, Key.PF1, KeyboardModifiers.RIGHT_ALT, False)
-        self._assert_get_key(207, None, KeyboardModifiers.NONE, True)
-        self._assert_get_key(98, Key.LOWER_C, KeyboardModifiers.NONE, False)
+        self._assert_get_keys([
+            (96, Key.LOWER_A, KeyboardModifiers.NONE, False),
+            (79, Key.RIGHT_ALT, KeyboardModifiers.RIGHT_ALT, True),
+            (33, Key.PF1, KeyboardModifiers.RIGHT_ALT, False),
+            (207, None, KeyboardModifiers.NONE, True),
+            (98, Key.LOWER_C, KeyboardModifiers.NONE, False)
+        ])
 
     def test_unmapped_alt(self):
-        self._assert_get_key(96, Key.LOWER_A, KeyboardModifiers.NONE, False)
-        self._assert_get_key(79, Key.RIGHT_ALT, KeyboardModifiers.RIGHT_ALT, True)
-        self._assert_get_key(97, Key.LOWER_B, KeyboardModifiers.RIGHT_ALT, False)
-        self._assert_get_key(207, None, KeyboardModifiers.NONE, True)
-        self._assert_get_key(98, Key.LOWER_C, KeyboardModifiers.NONE, False)
+        self._assert_get_keys([
+            (96, Key.LOWER_A, KeyboardModifiers.NONE, False),
+            (79, Key.RIGHT_ALT, KeyboardModifiers.RIGHT_ALT, True),
+            (97, Key.LOWER_B, KeyboardModifiers.RIGHT_ALT, False),
+            (207, None, KeyboardModifiers.NONE, True),
+            (98, Key.LOWER_C, KeyboardModifiers.NONE, False)
+        ])
 
     def test_alt_and_shift(self):
-        self._assert_get_key(96, Key.LOWER_A, KeyboardModifiers.NONE, False)
-        self._assert_get_key(79, Key.RIGHT_ALT, KeyboardModifiers.RIGHT_ALT, True)
-        self._assert_get_key(97, Key.LOWER_B, KeyboardModifiers.RIGHT_ALT, False)
-        self._assert_get_key(77, Key.LEFT_SHIFT, KeyboardModifiers.RIGHT_ALT | KeyboardModifiers.LEFT_SHIFT, True)
-        self._assert_get_key(98, Key.UPPER_C, KeyboardModifiers.RIGHT_ALT | KeyboardModifiers.LEFT_SHIFT, False)
-        self._assert_get_key(205, None, KeyboardModifiers.RIGHT_ALT, True)
-        self._assert_get_key(99, Key.LOWER_D, KeyboardModifiers.RIGHT_ALT, False)
-        self._assert_get_key(207, None, KeyboardModifiers.NONE, True)
-        self._assert_get_key(100, Key.LOWER_E, KeyboardModifiers.NONE, False)
+        self._assert_get_keys([
+            (96, Key.LOWER_A, KeyboardModifiers.NONE, False),
+            (79, Key.RIGHT_ALT, KeyboardModifiers.RIGHT_ALT, True),
+            (97, Key.LOWER_B, KeyboardModifiers.RIGHT_ALT, False),
+            (77, Key.LEFT_SHIFT, RIGHT_ALT_AND_LEFT_SHIFT, True),
+            (98, Key.UPPER_C, RIGHT_ALT_AND_LEFT_SHIFT, False),
+            (205, None, KeyboardModifiers.RIGHT_ALT, True),
+            (99, Key.LOWER_D, KeyboardModifiers.RIGHT_ALT, False),
+            (207, None, KeyboardModifiers.NONE, True),
+            (100, Key.LOWER_E, KeyboardModifiers.NONE, False)
+        ])
 
     def test_caps_lock(self):
-        self._assert_get_key(96, Key.LOWER_A, KeyboardModifiers.NONE, False)
-        self._assert_get_key(76, Key.CAPS_LOCK, KeyboardModifiers.CAPS_LOCK, True)
-        self._assert_get_key(204, None, KeyboardModifiers.CAPS_LOCK, False)
-        self._assert_get_key(97, Key.UPPER_B, KeyboardModifiers.CAPS_LOCK, False)
-        self._assert_get_key(76, Key.CAPS_LOCK, KeyboardModifiers.NONE, True)
-        self._assert_get_key(204, None, KeyboardModifiers.NONE, False)
-        self._assert_get_key(98, Key.LOWER_C, KeyboardModifiers.NONE, False)
+        self._assert_get_keys([
+            (96, Key.LOWER_A, KeyboardModifiers.NONE, False),
+            (76, Key.CAPS_LOCK, KeyboardModifiers.CAPS_LOCK, True),
+            (204, None, KeyboardModifiers.CAPS_LOCK, False),
+            (97, Key.UPPER_B, KeyboardModifiers.CAPS_LOCK, False),
+            (76, Key.CAPS_LOCK, KeyboardModifiers.NONE, True),
+            (204, None, KeyboardModifiers.NONE, False),
+            (98, Key.LOWER_C, KeyboardModifiers.NONE, False)
+        ])
 
     def test_caps_lock_and_shift(self):
-        self._assert_get_key(96, Key.LOWER_A, KeyboardModifiers.NONE, False)
-        self._assert_get_key(76, Key.CAPS_LOCK, KeyboardModifiers.CAPS_LOCK, True)
-        self._assert_get_key(204, None, KeyboardModifiers.CAPS_LOCK, False)
-        self._assert_get_key(97, Key.UPPER_B, KeyboardModifiers.CAPS_LOCK, False)
-        self._assert_get_key(77, Key.LEFT_SHIFT, KeyboardModifiers.CAPS_LOCK | KeyboardModifiers.LEFT_SHIFT, True)
-        self._assert_get_key(98, Key.LOWER_C, KeyboardModifiers.CAPS_LOCK | KeyboardModifiers.LEFT_SHIFT, False)
-        self._assert_get_key(205, None, KeyboardModifiers.CAPS_LOCK, True)
-        self._assert_get_key(99, Key.UPPER_D, KeyboardModifiers.CAPS_LOCK, False)
-        self._assert_get_key(76, Key.CAPS_LOCK, KeyboardModifiers.NONE, True)
-        self._assert_get_key(204, None, KeyboardModifiers.NONE, False)
-        self._assert_get_key(100, Key.LOWER_E, KeyboardModifiers.NONE, False)
-
-    def _assert_get_key(self, scan_code, key, modifiers, modifiers_changed):
-        self.assertEqual(self.keyboard.get_key(scan_code), (key, modifiers, modifiers_changed))
+        self._assert_get_keys([
+            (96, Key.LOWER_A, KeyboardModifiers.NONE, False),
+            (76, Key.CAPS_LOCK, KeyboardModifiers.CAPS_LOCK, True),
+            (204, None, KeyboardModifiers.CAPS_LOCK, False),
+            (97, Key.UPPER_B, KeyboardModifiers.CAPS_LOCK, False),
+            (77, Key.LEFT_SHIFT, CAPS_LOCK_AND_LEFT_SHIFT, True),
+            (98, Key.LOWER_C, CAPS_LOCK_AND_LEFT_SHIFT, False),
+            (205, None, KeyboardModifiers.CAPS_LOCK, True),
+            (99, Key.UPPER_D, KeyboardModifiers.CAPS_LOCK, False),
+            (76, Key.CAPS_LOCK, KeyboardModifiers.NONE, True),
+            (204, None, KeyboardModifiers.NONE, False),
+            (100, Key.LOWER_E, KeyboardModifiers.NONE, False)
+        ])
+
+    def _assert_get_keys(self, sequence):
+        get_key = self.keyboard.get_key
+
+        # Compare the whole sequence at once, each expected result is the key, modifiers
+        # and whether the modifiers changed.
+        self.assertEqual([get_key(scan_code) for (scan_code, *_) in sequence], [tuple(expected) for (_, *expected) in sequence])
 
 class GetCharacterForKeyTestCase(unittest.TestCase):
     def test_none(self):
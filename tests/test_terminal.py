@@ -1,5 +1,6 @@
 import unittest
-from unittest.mock import create_autospec
+from types import MappingProxyType
+from unittest.mock import Mock
 from coax import PollAction
 from coax.protocol import TerminalId
 
@@ -13,6 +14,11 @@ from oec.keymap_3278_typewriter import KEYMAP
 
 from mock_interface import MockInterface
 
+# Shared by every terminal created by _create_terminal, none of the tests modify these.
+TERMINAL_ID = TerminalId(0b11110100)
+EXTENDED_ID = 'c1348300'
+FEATURES = MappingProxyType({ })
+
 class InitTerminalTestCase(unittest.TestCase):
     def test_supported_terminal_model(self):
         # Arrange
@@ -32,24 +38,36 @@ class InitTerminalTestCase(unittest.TestCase):
             Terminal(None, None, terminal_id, None, { }, KEYMAP)
 
 class TerminalSetupTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._display = Mock(spec=Display)
+        cls._display.status_line = Mock(spec=StatusLine)
+
     def setUp(self):
         self.interface = MockInterface()
 
         self.terminal = _create_terminal(self.interface)
 
-        self.terminal.display = create_autospec(Display, instance=True)
-        self.terminal.display.status_line = create_autospec(StatusLine, instance=True)
+        self.terminal.display = self._display
+
+        self.terminal.display.reset_mock()
 
     def test(self):
         self.terminal.setup()
 
 class TerminalGetPollActionTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._display = Mock(spec=Display)
+
     def setUp(self):
         self.interface = MockInterface()
 
         self.terminal = _create_terminal(self.interface)
 
-        self.terminal.display = create_autospec(Display, instance=True)
+        self.terminal.display = self._display
+
+        self.terminal.display.reset_mock()
 
         # The terminal will be initialized in a state where the terminal keyboard clicker
         # state is unknown, and this cannot be read. Therefore the first POLL will always
@@ -76,11 +94,6 @@ class TerminalGetPollActionTestCase(unittest.TestCase):
         self.assertEqual(self.terminal.get_poll_action(), PollAction.ENABLE_KEYBOARD_CLICKER)
 
 def _create_terminal(interface):
-    terminal_id = TerminalId(0b11110100)
-    extended_id = 'c1348300'
-    features = { }
-    keymap = KEYMAP
-
-    terminal = Terminal(InterfaceWrapper(interface), None, terminal_id, extended_id, features, keymap)
+    terminal = Terminal(InterfaceWrapper(interface), None, TERMINAL_ID, EXTENDED_ID, FEATURES, KEYMAP)
 
     return terminal
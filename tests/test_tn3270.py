@@ -10,19 +10,51 @@ import context
 
 from oec.interface import InterfaceWrapper
 from oec.terminal import Terminal
-from oec.display import Dimensions, BufferedDisplay, StatusLine
+from oec.display import Dimensions, StatusLine
 from oec.keyboard import Key, KeyboardModifiers
 from oec.keymap_3278_typewriter import KEYMAP
 from oec.session import SessionDisconnectedError
 from oec.tn3270 import TN3270Session
 
 from mock_interface import MockInterface
+from recording_display import RecordingBufferedDisplay
+
+# Expected regen and EAB bytes for the screen rendered by the render tests.
+RENDER_REGEN_BYTES = bytes.fromhex('e0afb1aeb3a4a2b3a4a3e8afb1aeb3a4a2b3a4a300a8adb3a4adb2a8a5a8a4a3ecafb1aeb3a4a2b3a4a300a7a8a3a3a4adc0b4adafb1aeb3a4a2b3a4a3c8b4adafb1aeb3a4a2b3a4a300a8adb3a4adb2a8a5a8a4a3ccb4adafb1aeb3a4a2b3a4a300a7a8a3a3a4ade0a4a0a1e0')
+RENDER_EAB_BYTES = bytes.fromhex('0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000304080c000')
+
+# Expected status line message areas.
+MESSAGE_AREA_KEYBOARD_LOCKED = bytes.fromhex('f600b2b8b2b3a4ac00')
+MESSAGE_AREA_PROTECTED_CELL = bytes.fromhex('f600f8dbd800000000')
+MESSAGE_AREA_FIELD_OVERFLOW = bytes.fromhex('f600db080000000000')
+
+# Addresses changed by the render tests, render() clears the dirty set so each test
+# needs its own copy.
+RENDER_DIRTY = frozenset(range(109))
+
+# Strings written to the screen by the render tests, encoded once.
+EBCDIC_STRINGS = {string: string.encode('ibm037') for string in [
+    'PROTECTED',
+    'PROTECTED INTENSIFIED',
+    'PROTECTED HIDDEN',
+    'UNPROTECTED',
+    'UNPROTECTED INTENSIFIED',
+    'UNPROTECTED HIDDEN',
+    'EAB'
+]}
 
 class SessionHandleHostTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.interface = MockInterface()
+
+        # Handling the host only reaches the emulator and Telnet, so the terminal is shared.
+        cls.terminal = _create_terminal(cls.interface)
+
     def setUp(self):
-        self.interface = MockInterface()
+        self.interface.mock_responses = []
 
-        self.terminal = _create_terminal(self.interface)
+        self.interface.reset_mock()
 
         self.session = TN3270Session(self.terminal, 'mainframe', 23, None, 'ibm037', 'default')
 
@@ -66,10 +98,14 @@ class SessionHandleHostTestCase(unittest.TestCase):
         self.telnet.close.assert_called()
 
 class SessionHandleKeyTestCase(unittest.TestCase):
-    def setUp(self):
-        self.interface = MockInterface()
+    @classmethod
+    def setUpClass(cls):
+        cls.interface = MockInterface()
 
-        self.terminal = _create_terminal(self.interface)
+        cls.terminal = _create_terminal(cls.interface)
+
+    def setUp(self):
+        self.terminal.display.status_line.reset_mock()
 
         self.session = TN3270Session(self.terminal, 'mainframe', 23, None, 'ibm037', 'default')
 
@@ -78,124 +114,37 @@ class SessionHandleKeyTestCase(unittest.TestCase):
         self.session.emulator.cells = []
         self.session.emulator.dirty = set()
 
-    def test_enter(self):
-        # Act
-        self.session.handle_key(Key.ENTER, KeyboardModifiers.NONE, None)
-
-        # Assert
-        self.session.emulator.aid.assert_called_with(AID.ENTER)
-
-    def test_tab(self):
-        # Act
-        self.session.handle_key(Key.TAB, KeyboardModifiers.NONE, None)
-
-        # Assert
-        self.session.emulator.tab.assert_called()
-
-    def test_backtab(self):
-        # Act
-        self.session.handle_key(Key.BACKTAB, KeyboardModifiers.NONE, None)
-
-        # Assert
-        self.session.emulator.tab.assert_called_with(direction=-1)
-
-    def test_newline(self):
-        # Act
-        self.session.handle_key(Key.NEWLINE, KeyboardModifiers.NONE, None)
-
-        # Assert
-        self.session.emulator.newline.assert_called()
-
-    def test_home(self):
-        # Act
-        self.session.handle_key(Key.HOME, KeyboardModifiers.NONE, None)
-
-        # Assert
-        self.session.emulator.home.assert_called()
-
-    def test_up(self):
-        # Act
-        self.session.handle_key(Key.UP, KeyboardModifiers.NONE, None)
-
-        # Assert
-        self.session.emulator.cursor_up.assert_called()
-
-    def test_down(self):
-        # Act
-        self.session.handle_key(Key.DOWN, KeyboardModifiers.NONE, None)
-
-        # Assert
-        self.session.emulator.cursor_down.assert_called()
-
-    def test_left(self):
-        # Act
-        self.session.handle_key(Key.LEFT, KeyboardModifiers.NONE, None)
-
-        # Assert
-        self.session.emulator.cursor_left.assert_called()
-
-    def test_left_2(self):
-        # Act
-        self.session.handle_key(Key.LEFT_2, KeyboardModifiers.NONE, None)
-
-        # Assert
-        self.session.emulator.cursor_left.assert_called_with(rate=2)
-
-    def test_right(self):
-        # Act
-        self.session.handle_key(Key.RIGHT, KeyboardModifiers.NONE, None)
-
-        # Assert
-        self.session.emulator.cursor_right.assert_called()
-
-    def test_right_2(self):
-        # Act
-        self.session.handle_key(Key.RIGHT_2, KeyboardModifiers.NONE, None)
-
-        # Assert
-        self.session.emulator.cursor_right.assert_called_with(rate=2)
-
-    def test_backspace(self):
-        # Act
-        self.session.handle_key(Key.BACKSPACE, KeyboardModifiers.NONE, None)
-
-        # Assert
-        self.session.emulator.backspace.assert_called()
-
-    def test_delete(self):
-        # Act
-        self.session.handle_key(Key.DELETE, KeyboardModifiers.NONE, None)
-
-        # Assert
-        self.session.emulator.delete.assert_called()
-
-    def test_erase_eof(self):
-        # Act
-        self.session.handle_key(Key.ERASE_EOF, KeyboardModifiers.NONE, None)
-
-        # Assert
-        self.session.emulator.erase_end_of_field.assert_called()
-
-    def test_erase_input(self):
-        # Act
-        self.session.handle_key(Key.ERASE_INPUT, KeyboardModifiers.NONE, None)
-
-        # Assert
-        self.session.emulator.erase_input.assert_called()
-
-    def test_dup(self):
-        # Act
-        self.session.handle_key(Key.DUP, KeyboardModifiers.NONE, None)
-
-        # Assert
-        self.session.emulator.dup.assert_called()
-
-    def test_field_mark(self):
-        # Act
-        self.session.handle_key(Key.FIELD_MARK, KeyboardModifiers.NONE, None)
-
-        # Assert
-        self.session.emulator.field_mark.assert_called()
+    def test_emulator_keys(self):
+        CASES = [
+            (Key.ENTER, 'aid', (AID.ENTER,), { }),
+            (Key.TAB, 'tab', (), { }),
+            (Key.BACKTAB, 'tab', (), {'direction': -1}),
+            (Key.NEWLINE, 'newline', (), { }),
+            (Key.HOME, 'home', (), { }),
+            (Key.UP, 'cursor_up', (), { }),
+            (Key.DOWN, 'cursor_down', (), { }),
+            (Key.LEFT, 'cursor_left', (), { }),
+            (Key.LEFT_2, 'cursor_left', (), {'rate': 2}),
+            (Key.RIGHT, 'cursor_right', (), { }),
+            (Key.RIGHT_2, 'cursor_right', (), {'rate': 2}),
+            (Key.BACKSPACE, 'backspace', (), { }),
+            (Key.DELETE, 'delete', (), { }),
+            (Key.ERASE_EOF, 'erase_end_of_field', (), { }),
+            (Key.ERASE_INPUT, 'erase_input', (), { }),
+            (Key.DUP, 'dup', (), { }),
+            (Key.FIELD_MARK, 'field_mark', (), { })
+        ]
+
+        for (key, method, args, kwargs) in CASES:
+            with self.subTest(key=key):
+                # Arrange
+                self.session.emulator.reset_mock()
+
+                # Act
+                self.session.handle_key(key, KeyboardModifiers.NONE, None)
+
+                # Assert
+                getattr(self.session.emulator, method).assert_called_with(*args, **kwargs)
 
     def test_input(self):
         # Act
@@ -241,15 +190,22 @@ class SessionHandleKeyTestCase(unittest.TestCase):
         self.assertIsInstance(self.session.operator_error, ProtectedCellOperatorError)
 
 class SessionRenderTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.interface = MockInterface()
+
     def setUp(self):
-        self.interface = MockInterface()
+        self.interface.mock_responses = []
+
+        self.interface.reset_mock()
 
         self.terminal = _create_terminal(self.interface)
 
-        self.terminal.display.buffered_write_byte = Mock(wraps=self.terminal.display.buffered_write_byte)
-        self.terminal.display.move_cursor = Mock(wraps=self.terminal.display.move_cursor)
-        self.terminal.display.flush = Mock(wraps=self.terminal.display.flush)
-        self.terminal.display.status_line.write = Mock(wraps=self.terminal.display.status_line.write)
+        status_line = self.terminal.display.status_line
+
+        self.terminal.display = RecordingBufferedDisplay(self.terminal, Dimensions(24, 80), None)
+
+        self.terminal.display.status_line = status_line
 
         self.session = TN3270Session(self.terminal, 'mainframe', 23, None, 'ibm037', 'default')
 
@@ -263,91 +219,84 @@ class SessionRenderTestCase(unittest.TestCase):
         cells = _create_screen_cells(24, 80)
 
         _set_attribute(cells, 0, protected=True)
-        _set_characters(cells, 1, 'PROTECTED'.encode('ibm037'))
+        _set_characters(cells, 1, EBCDIC_STRINGS['PROTECTED'])
         _set_attribute(cells, 10, protected=True, intensified=True)
-        _set_characters(cells, 11, 'PROTECTED INTENSIFIED'.encode('ibm037'))
+        _set_characters(cells, 11, EBCDIC_STRINGS['PROTECTED INTENSIFIED'])
         _set_attribute(cells, 32, protected=True, hidden=True)
-        _set_characters(cells, 33, 'PROTECTED HIDDEN'.encode('ibm037'))
+        _set_characters(cells, 33, EBCDIC_STRINGS['PROTECTED HIDDEN'])
         _set_attribute(cells, 49, protected=False)
-        _set_characters(cells, 50, 'UNPROTECTED'.encode('ibm037'))
+        _set_characters(cells, 50, EBCDIC_STRINGS['UNPROTECTED'])
         _set_attribute(cells, 61, protected=False, intensified=True)
-        _set_characters(cells, 62, 'UNPROTECTED INTENSIFIED'.encode('ibm037'))
+        _set_characters(cells, 62, EBCDIC_STRINGS['UNPROTECTED INTENSIFIED'])
         _set_attribute(cells, 85, protected=False, hidden=True)
-        _set_characters(cells, 86, 'UNPROTECTED HIDDEN'.encode('ibm037'))
+        _set_characters(cells, 86, EBCDIC_STRINGS['UNPROTECTED HIDDEN'])
         _set_attribute(cells, 104, protected=True)
         _set_formatting(cells, 104, color=Color.YELLOW)
-        _set_characters(cells, 105, 'EAB'.encode('ibm037'))
+        _set_characters(cells, 105, EBCDIC_STRINGS['EAB'])
         _set_formatting(cells, 105, blink=True)
         _set_formatting(cells, 106, reverse=True)
         _set_formatting(cells, 107, underscore=True)
         _set_attribute(cells, 108, protected=True)
 
         self.session.emulator.cells = cells
-        self.session.emulator.dirty = set(range(109))
+        self.session.emulator.dirty = set(RENDER_DIRTY)
         self.session.emulator.cursor_address = 8
 
         # Act
         self.session.render()
 
         # Assert
-        regen_bytes = bytes.fromhex('e0afb1aeb3a4a2b3a4a3e8afb1aeb3a4a2b3a4a300a8adb3a4adb2a8a5a8a4a3ecafb1aeb3a4a2b3a4a300a7a8a3a3a4adc0b4adafb1aeb3a4a2b3a4a3c8b4adafb1aeb3a4a2b3a4a300a8adb3a4adb2a8a5a8a4a3ccb4adafb1aeb3a4a2b3a4a300a7a8a3a3a4ade0a4a0a1e0')
+        expected_writes = {(regen_byte, None, index, None, None) for (index, regen_byte) in enumerate(RENDER_REGEN_BYTES)}
 
-        for (index, regen_byte) in enumerate(regen_bytes):
-            self.terminal.display.buffered_write_byte.assert_any_call(regen_byte, None, index=index)
+        self.assertEqual(expected_writes - set(self.terminal.display.buffered_writes), set())
 
-        self.terminal.display.flush.assert_called()
+        self.assertGreater(self.terminal.display.flush_count, 0)
 
-        self.terminal.display.move_cursor.assert_called_with(index=8)
+        self.assertEqual(self.terminal.display.cursor_moves[-1], {'index': 8})
 
         self.assertFalse(self.session.emulator.dirty)
 
     def test_with_eab_feature(self):
         # Arrange
-        self.terminal.display = BufferedDisplay(self.terminal, Dimensions(24, 80), 7)
-
-        self.terminal.display.buffered_write_byte = Mock(wraps=self.terminal.display.buffered_write_byte)
-        self.terminal.display.move_cursor = Mock(wraps=self.terminal.display.move_cursor)
-        self.terminal.display.flush = Mock(wraps=self.terminal.display.flush)
+        self.terminal.display = RecordingBufferedDisplay(self.terminal, Dimensions(24, 80), 7)
 
         cells = _create_screen_cells(24, 80)
 
         _set_attribute(cells, 0, protected=True)
-        _set_characters(cells, 1, 'PROTECTED'.encode('ibm037'))
+        _set_characters(cells, 1, EBCDIC_STRINGS['PROTECTED'])
         _set_attribute(cells, 10, protected=True, intensified=True)
-        _set_characters(cells, 11, 'PROTECTED INTENSIFIED'.encode('ibm037'))
+        _set_characters(cells, 11, EBCDIC_STRINGS['PROTECTED INTENSIFIED'])
         _set_attribute(cells, 32, protected=True, hidden=True)
-        _set_characters(cells, 33, 'PROTECTED HIDDEN'.encode('ibm037'))
+        _set_characters(cells, 33, EBCDIC_STRINGS['PROTECTED HIDDEN'])
         _set_attribute(cells, 49, protected=False)
-        _set_characters(cells, 50, 'UNPROTECTED'.encode('ibm037'))
+        _set_characters(cells, 50, EBCDIC_STRINGS['UNPROTECTED'])
         _set_attribute(cells, 61, protected=False, intensified=True)
-        _set_characters(cells, 62, 'UNPROTECTED INTENSIFIED'.encode('ibm037'))
+        _set_characters(cells, 62, EBCDIC_STRINGS['UNPROTECTED INTENSIFIED'])
         _set_attribute(cells, 85, protected=False, hidden=True)
-        _set_characters(cells, 86, 'UNPROTECTED HIDDEN'.encode('ibm037'))
+        _set_characters(cells, 86, EBCDIC_STRINGS['UNPROTECTED HIDDEN'])
         _set_attribute(cells, 104, protected=True)
         _set_formatting(cells, 104, color=Color.YELLOW)
-        _set_characters(cells, 105, 'EAB'.encode('ibm037'))
+        _set_characters(cells, 105, EBCDIC_STRINGS['EAB'])
         _set_formatting(cells, 105, blink=True)
         _set_formatting(cells, 106, reverse=True)
         _set_formatting(cells, 107, underscore=True)
         _set_attribute(cells, 108, protected=True)
 
         self.session.emulator.cells = cells
-        self.session.emulator.dirty = set(range(109))
+        self.session.emulator.dirty = set(RENDER_DIRTY)
         self.session.emulator.cursor_address = 8
 
         # Act
         self.session.render()
 
         # Assert
-        regen_bytes = bytes.fromhex('e0afb1aeb3a4a2b3a4a3e8afb1aeb3a4a2b3a4a300a8adb3a4adb2a8a5a8a4a3ecafb1aeb3a4a2b3a4a300a7a8a3a3a4adc0b4adafb1aeb3a4a2b3a4a3c8b4adafb1aeb3a4a2b3a4a300a8adb3a4adb2a8a5a8a4a3ccb4adafb1aeb3a4a2b3a4a300a7a8a3a3a4ade0a4a0a1e0')
-        eab_bytes = bytes.fromhex('0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000304080c000')
+        expected_writes = {(regen_byte, eab_byte, index, None, None) for (index, (regen_byte, eab_byte)) in enumerate(zip(RENDER_REGEN_BYTES, RENDER_EAB_BYTES))}
 
-        for (index, (regen_byte, eab_byte)) in enumerate(zip(regen_bytes, eab_bytes)):
-            self.terminal.display.buffered_write_byte.assert_any_call(regen_byte, eab_byte, index=index)
+        self.assertEqual(expected_writes - set(self.terminal.display.buffered_writes), set())
 
-        self.terminal.display.flush.assert_called()
+        self.assertGreater(self.terminal.display.flush_count, 0)
 
-        self.terminal.display.move_cursor.assert_called_with(index=8)
+        self.assertEqual(self.terminal.display.cursor_moves[-1], {'index': 8})
 
         self.assertFalse(self.session.emulator.dirty)
 
@@ -362,7 +311,7 @@ class SessionRenderTestCase(unittest.TestCase):
         self.session.render()
 
         # Assert
-        self.terminal.display.status_line.write.assert_called_with(8, bytes.fromhex('f600b2b8b2b3a4ac00'))
+        self.terminal.display.status_line.write.assert_called_with(8, MESSAGE_AREA_KEYBOARD_LOCKED)
 
     def test_protected_cell_operator_error(self):
         # Arrange
@@ -376,7 +325,7 @@ class SessionRenderTestCase(unittest.TestCase):
         self.session.render()
 
         # Assert
-        self.terminal.display.status_line.write.assert_called_with(8, bytes.fromhex('f600f8dbd800000000'))
+        self.terminal.display.status_line.write.assert_called_with(8, MESSAGE_AREA_PROTECTED_CELL)
 
     def test_field_overflow_operator_error(self):
         # Arrange
@@ -390,7 +339,7 @@ class SessionRenderTestCase(unittest.TestCase):
         self.session.render()
 
         # Assert
-        self.terminal.display.status_line.write.assert_called_with(8, bytes.fromhex('f600db080000000000'))
+        self.terminal.display.status_line.write.assert_called_with(8, MESSAGE_AREA_FIELD_OVERFLOW)
 
 def _create_terminal(interface):
     terminal_id = TerminalId(0b11110100)
@@ -415,10 +364,7 @@ def _set_attribute(cells, index, protected=False, intensified=False, hidden=Fals
     cells[index] = AttributeCell(attribute)
 
 def _set_characters(cells, index, bytes_):
-    for byte in bytes_:
-        cells[index] = CharacterCell(byte)
-
-        index += 1
+    cells[index:index+len(bytes_)] = [CharacterCell(byte) for byte in bytes_]
 
 def _set_formatting(cells, index, color=0x00, blink=False, reverse=False, underscore=False):
     if color == 0x00 and not blink and not reverse and not underscore:
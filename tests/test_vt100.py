@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import Mock, create_autospec
+from unittest.mock import create_autospec
 
 from logging import Logger
 from ptyprocess import PtyProcess
@@ -9,21 +9,30 @@ import context
 
 from oec.interface import InterfaceWrapper
 from oec.terminal import Terminal
-from oec.display import Dimensions, BufferedDisplay
+from oec.display import Dimensions
 from oec.keyboard import Key, KeyboardModifiers
 from oec.keymap_3278_typewriter import KEYMAP
 from oec.session import SessionDisconnectedError
 from oec.vt100 import VT100Session
 
 from mock_interface import MockInterface
+from recording_display import RecordingBufferedDisplay
+
+# Expected regen and EAB data for the first row after the host outputs abc.
+ROW_REGEN_DATA = bytes.fromhex('808182') + bytes(77)
+ROW_EAB_DATA = bytes(80)
 
 class SessionHandleHostTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.interface = MockInterface()
+
     def setUp(self):
-        self.interface = MockInterface()
+        self.interface.mock_responses = []
 
-        self.terminal = _create_terminal(self.interface)
+        self.interface.reset_mock()
 
-        self.terminal.sound_alarm = Mock(wraps=self.terminal.sound_alarm)
+        self.terminal = _create_terminal(self.interface)
 
         self.session = VT100Session(self.terminal, None)
 
@@ -31,7 +40,7 @@ class SessionHandleHostTestCase(unittest.TestCase):
 
     def test(self):
         # Arrange
-        self.session.host_process.read = Mock(return_value=b'abc')
+        self.session.host_process.read.return_value = b'abc'
 
         # Act
         self.session.handle_host()
@@ -45,7 +54,7 @@ class SessionHandleHostTestCase(unittest.TestCase):
 
     def test_eof(self):
         # Arrange
-        self.session.host_process.read = Mock(side_effect=EOFError)
+        self.session.host_process.read.side_effect = EOFError
 
         # Act and assert
         with self.assertRaises(SessionDisconnectedError):
@@ -55,51 +64,57 @@ class SessionHandleHostTestCase(unittest.TestCase):
 
     def test_bell(self):
         # Arrange
-        self.session.host_process.read = Mock(return_value=b'\a')
+        self.session.host_process.read.return_value = b'\a'
 
         # Act
         self.session.handle_host()
 
         # Assert
-        self.terminal.sound_alarm.assert_called()
+        self.assertTrue(self.terminal.alarm)
 
 class SessionHandleKeyTestCase(unittest.TestCase):
-    def setUp(self):
-        self.interface = MockInterface()
+    @classmethod
+    def setUpClass(cls):
+        cls.interface = MockInterface()
 
-        self.terminal = _create_terminal(self.interface)
+        # Handling a key only writes to the host process or logs a warning, so the
+        # terminal and session are shared.
+        cls.terminal = _create_terminal(cls.interface)
 
-        self.session = VT100Session(self.terminal, None)
+        cls.session = VT100Session(cls.terminal, None)
 
-        self.session.host_process = create_autospec(PtyProcess, instance=True)
+        cls.session.host_process = create_autospec(PtyProcess, instance=True)
+        cls.session.logger = create_autospec(Logger, instance=True)
 
-    def test_printable(self):
-        # Act
-        self.session.handle_key(Key.LOWER_A, KeyboardModifiers.NONE, None)
+    def setUp(self):
+        self.interface.mock_responses = []
 
-        # Assert
-        self.session.host_process.write.assert_called_with(b'a')
+        self.interface.reset_mock()
 
-    # TODO: Test the unprintable branch.
+        self.session.host_process.reset_mock()
+        self.session.logger.reset_mock()
 
-    def test_mapped(self):
-        # Act
-        self.session.handle_key(Key.ENTER, KeyboardModifiers.NONE, None)
+    def test_keys(self):
+        CASES = [
+            (Key.LOWER_A, KeyboardModifiers.NONE, b'a'),
+            (Key.ENTER, KeyboardModifiers.NONE, b'\r'),
+            (Key.LOWER_C, KeyboardModifiers.LEFT_ALT, b'\x03')
+        ]
 
-        # Assert
-        self.session.host_process.write.assert_called_with(b'\r')
+        for (key, modifiers, expected_bytes) in CASES:
+            with self.subTest(key=key, modifiers=modifiers):
+                # Arrange
+                self.session.host_process.reset_mock()
 
-    def test_mapped_alt_modifier(self):
-        # Act
-        self.session.handle_key(Key.LOWER_C, KeyboardModifiers.LEFT_ALT, None)
+                # Act
+                self.session.handle_key(key, modifiers, None)
 
-        # Assert
-        self.session.host_process.write.assert_called_with(b'\x03')
+                # Assert
+                self.session.host_process.write.assert_called_with(expected_bytes)
 
-    def test_unmapped_alt_modifier(self):
-        # Arrange
-        self.session.logger = create_autospec(Logger, instance=True)
+    # TODO: Test the unprintable branch.
 
+    def test_unmapped_alt_modifier(self):
         # Act
         self.session.handle_key(Key.THREE, KeyboardModifiers.LEFT_ALT, None)
 
@@ -116,14 +131,18 @@ class SessionHandleKeyTestCase(unittest.TestCase):
         self.session.host_process.write.assert_not_called()
 
 class SessionRenderTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.interface = MockInterface()
+
     def setUp(self):
-        self.interface = MockInterface()
+        self.interface.mock_responses = []
+
+        self.interface.reset_mock()
 
         self.terminal = _create_terminal(self.interface)
 
-        self.terminal.display.buffered_write_byte = Mock(wraps=self.terminal.display.buffered_write_byte)
-        self.terminal.display.move_cursor = Mock(wraps=self.terminal.display.move_cursor)
-        self.terminal.display.flush = Mock(wraps=self.terminal.display.flush)
+        self.terminal.display = RecordingBufferedDisplay(self.terminal, Dimensions(24, 80), None)
 
         self.session = VT100Session(self.terminal, None)
 
@@ -133,7 +152,7 @@ class SessionRenderTestCase(unittest.TestCase):
         # Arrange
         self.session.is_first_render = False
 
-        self.session.host_process.read = Mock(return_value=b'abc')
+        self.session.host_process.read.return_value = b'abc'
 
         self.session.handle_host()
 
@@ -141,27 +160,23 @@ class SessionRenderTestCase(unittest.TestCase):
         self.session.render()
 
         # Assert
-        self.terminal.display.buffered_write_byte.assert_any_call(0x80, None, row=0, column=0)
-        self.terminal.display.buffered_write_byte.assert_any_call(0x81, None, row=0, column=1)
-        self.terminal.display.buffered_write_byte.assert_any_call(0x82, None, row=0, column=2)
+        expected_writes = {(ROW_REGEN_DATA, None, None, 0, 0)}
 
-        self.terminal.display.flush.assert_called()
+        self.assertEqual(expected_writes - set(self.terminal.display.buffered_writes), set())
 
-        self.terminal.display.move_cursor.assert_called_with(row=0, column=3)
+        self.assertGreater(self.terminal.display.flush_count, 0)
+
+        self.assertEqual(self.terminal.display.cursor_moves[-1], {'row': 0, 'column': 3})
 
         self.assertFalse(self.session.vt100_screen.dirty)
 
     def test_with_eab_feature(self):
         # Arrange
-        self.terminal.display = BufferedDisplay(self.terminal, Dimensions(24, 80), 7)
-
-        self.terminal.display.buffered_write_byte = Mock(wraps=self.terminal.display.buffered_write_byte)
-        self.terminal.display.move_cursor = Mock(wraps=self.terminal.display.move_cursor)
-        self.terminal.display.flush = Mock(wraps=self.terminal.display.flush)
+        self.terminal.display = RecordingBufferedDisplay(self.terminal, Dimensions(24, 80), 7)
 
         self.session.is_first_render = False
 
-        self.session.host_process.read = Mock(return_value=b'abc')
+        self.session.host_process.read.return_value = b'abc'
 
         self.session.handle_host()
 
@@ -169,13 +184,13 @@ class SessionRenderTestCase(unittest.TestCase):
         self.session.render()
 
         # Assert
-        self.terminal.display.buffered_write_byte.assert_any_call(0x80, 0x00, row=0, column=0)
-        self.terminal.display.buffered_write_byte.assert_any_call(0x81, 0x00, row=0, column=1)
-        self.terminal.display.buffered_write_byte.assert_any_call(0x82, 0x00, row=0, column=2)
+        expected_writes = {(ROW_REGEN_DATA, ROW_EAB_DATA, None, 0, 0)}
+
+        self.assertEqual(expected_writes - set(self.terminal.display.buffered_writes), set())
 
-        self.terminal.display.flush.assert_called()
+        self.assertGreater(self.terminal.display.flush_count, 0)
 
-        self.terminal.display.move_cursor.assert_called_with(row=0, column=3)
+        self.assertEqual(self.terminal.display.cursor_moves[-1], {'row': 0, 'column': 3})
 
         self.assertFalse(self.session.vt100_screen.dirty)
 